@@ -4,9 +4,10 @@ Arabic morphological types and data structures.
 
 ### THIS FILE WAS CREATED TO AVOID CIRCULAR LOOP ( IMPORT INSIDE AN IMPORT) SO I MIGRATED THE TYPES HERE IN A SOLE FILE
 
+import sys
 from enum import Enum
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Optional, Tuple
 
 class RootCategory(Enum):
     """Main categories of Arabic roots."""
@@ -30,16 +31,26 @@ class WeakSubtype(Enum):
     DOUBLE_WEAK_SEPARATED = "لفيف مفروق"
     DOUBLE_WEAK_JOINED = "لفيف مقرون"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RootAnalysis:
     """Complete analysis of an Arabic root."""
     root: str
     category: RootCategory
     subtype: Optional[str]
-    weak_positions: List[int]  # Positions of weak letters (0,1,2)
-    hamza_positions: List[int]  # Positions of hamza
+    weak_positions: Tuple[int, ...]  # Positions of weak letters (0,1,2)
+    hamza_positions: Tuple[int, ...]  # Positions of hamza
     is_doubled: bool
     description: str
     
+    def __post_init__(self):
+        # Analyses are cached and compared a lot: intern the short strings and
+        # store positions as tuples so instances stay small and immutable
+        object.__setattr__(self, 'root', sys.intern(self.root))
+        if self.subtype is not None:
+            object.__setattr__(self, 'subtype', sys.intern(self.subtype))
+        object.__setattr__(self, 'description', sys.intern(self.description))
+        object.__setattr__(self, 'weak_positions', tuple(self.weak_positions))
+        object.__setattr__(self, 'hamza_positions', tuple(self.hamza_positions))
+    
     def __str__(self) -> str:
         return f"{self.root}: {self.category.value} ({self.subtype})"
\ No newline at end of file
@@ -6,549 +6,864 @@ Features:
 - Root extraction and validation
 - Pattern matching helpers
 - Unicode utilities for Arabic script
+
+The helpers are plain module-level functions (no descriptor lookup on the
+hot path); ArabicUtils re-exports them as static methods for existing code.
 """
 
 import re
-from typing import Optional, List, Tuple
+import unicodedata
+from functools import lru_cache
+from typing import Callable, Optional, List, Tuple
 
-from arabic_types import RootCategory
-class ArabicUtils:
-    """Utilities for handling Arabic text in morphological processing."""
+
+# All Arabic letters
+ARABIC_LETTERS = frozenset({
+    # Base Arabic letters
+    'ا', 'ب', 'ت', 'ث', 'ج', 'ح', 'خ', 'د', 'ذ', 'ر', 'ز', 'س', 'ش', 'ص',
+    'ض', 'ط', 'ظ', 'ع', 'غ', 'ف', 'ق', 'ك', 'ل', 'م', 'ن', 'ه', 'و', 'ي',
     
-    # All Arabic letters 
-    ARABIC_LETTERS = {
-        # Base Arabic letters
-        'ا', 'ب', 'ت', 'ث', 'ج', 'ح', 'خ', 'د', 'ذ', 'ر', 'ز', 'س', 'ش', 'ص',
-        'ض', 'ط', 'ظ', 'ع', 'غ', 'ف', 'ق', 'ك', 'ل', 'م', 'ن', 'ه', 'و', 'ي',
-        
-        # Hamza and its forms
-        'ء', 'آ', 'أ', 'إ', 'ئ', 'ؤ',
-        
-        # Other Arabic letters
-        'ة', 'ى', 'ٱ', 'ە',
-        
-        # Persian/Arabic extensions
-        'پ', 'چ', 'ژ', 'گ', 'ڤ',
-    }
-
-    NORMALIZATION_MAP = {
-        'آ': 'ا',    # Maddah alef to alef
-        'أ': 'ا',    # Alef with hamza above to alef
-        'إ': 'ا',    # Alef with hamza below to alef
-        'ٱ': 'ا',    # Alef wasla to alef
-        'ى': 'ي',    # Alef maqsura to ya
-        'ة': 'ه',    # Ta marbuta to ha
-        'ؤ': 'و',    # Waw with hamza to waw
-        'ئ': 'ي',    # Ya with hamza to ya
-    }
-    
-    # Diacritics (tashkeel) to remove
-    DIACRITICS = {
-        '\u064B', '\u064C', '\u064D', '\u064E', '\u064F', '\u0650',
-        '\u0651', '\u0652', '\u0653', '\u0654', '\u0655'
-    }
-
-    ## Handles Shadda roots
-    @staticmethod
-    def expand_shadda(text: str) -> str:
-        """
-        Expand shadda (ّ) by doubling the letter before it.
-        
-        Example: 
-        - "مدّ" -> "مدد"
-        - "شدّ" -> "شدد"
-        
-        Args:
-            text (str): Arabic text with shadda
-            
-        Returns:
-            str: Text with shadda expanded
-        """
-        if not text:
-            return text
-        
-        result = []
-        i = 0
-        while i < len(text):
-            # Check if current character is a letter that might have shadda
-            if i + 1 < len(text) and text[i + 1] == '\u0651':  # Shadda
-                # Double the letter and skip the shadda
-                result.append(text[i])
-                result.append(text[i])
-                i += 2
-            else:
-                result.append(text[i])
-                i += 1
-        
-        return ''.join(result)
+    # Hamza and its forms
+    'ء', 'آ', 'أ', 'إ', 'ئ', 'ؤ',
     
-    @staticmethod
-    def normalize_arabic(text: str, aggressive: bool = False, expand_shadda: bool = True) -> str:
-        """
-        Normalize Arabic text with shadda expansion option.
-        
-        Args:
-            text (str): Input Arabic text
-            aggressive (bool): If True, normalize hamza and variations
-            expand_shadda (bool): If True, expand shadda to double letters
-            
-        Returns:
-            str: Normalized text
-        """
-        if not text:
-            return ""
-        
-        # Expand shadda first if requested
-        if expand_shadda:
-            text = ArabicUtils.expand_shadda(text)
-        
-        # Remove diacritics (except shadda which we already handled)
-        for diacritic in ArabicUtils.DIACRITICS:
-            text = text.replace(diacritic, '')
-        
-        if aggressive:
-            # Apply full normalization
-            for variant, standard in ArabicUtils.NORMALIZATION_MAP.items():
-                text = text.replace(variant, standard)
-        else:
-            # Preserve hamza for root letters
-            for variant, standard in [('آ', 'ا'), ('إ', 'ا'), ('ٱ', 'ا'), ('ى', 'ي'), ('ة', 'ه')]:
-                text = text.replace(variant, standard)
-        
-        # Remove non-Arabic characters
-        text = re.sub(r'[^\u0600-\u06FF\s]', '', text)
-        
+    # Other Arabic letters
+    'ة', 'ى', 'ٱ', 'ە',
+    
+    # Persian/Arabic extensions
+    'پ', 'چ', 'ژ', 'گ', 'ڤ',
+})
+
+NORMALIZATION_MAP = {
+    'آ': 'ا',    # Maddah alef to alef
+    'أ': 'ا',    # Alef with hamza above to alef
+    'إ': 'ا',    # Alef with hamza below to alef
+    'ٱ': 'ا',    # Alef wasla to alef
+    'ى': 'ي',    # Alef maqsura to ya
+    'ة': 'ه',    # Ta marbuta to ha
+    'ؤ': 'و',    # Waw with hamza to waw
+    'ئ': 'ي',    # Ya with hamza to ya
+}
+
+# Diacritics (tashkeel) to remove
+DIACRITICS = frozenset({
+    '\u064B', '\u064C', '\u064D', '\u064E', '\u064F', '\u0650',
+    '\u0651', '\u0652', '\u0653', '\u0654', '\u0655'
+})
+
+
+# Arabic presentation forms (U+FB50..U+FDFF, U+FE70..U+FEFF) folded to the
+# base letters with NFKC, computed once here instead of calling
+# unicodedata.normalize() per word. Without this the non-Arabic filter
+# would silently drop them. Isolated harakat fold to " " + mark, so the
+# padding is stripped; ligatures fold to several letters.
+def _build_presform_table() -> dict:
+    table = {}
+    for code in (*range(0xFB50, 0xFE00), *range(0xFE70, 0xFF00)):
+        char = chr(code)
+        folded = unicodedata.normalize('NFKC', char).strip()
+        if folded and folded != char:
+            table[code] = folded
+    return table
+
+_PRESFORM_TABLE = _build_presform_table()
+
+# Byte masks over the Arabic block (U+0600..U+06FF): every entry of
+# ARABIC_LETTERS (Persian extensions included) and DIACRITICS lives there,
+# so membership is a direct index instead of a hash lookup.
+_ARABIC_BLOCK_START = 0x0600
+
+def _block_mask(chars: frozenset) -> bytes:
+    return bytes(
+        1 if chr(_ARABIC_BLOCK_START + offset) in chars else 0
+        for offset in range(0x100)
+    )
+
+_LETTER_MASK = _block_mask(ARABIC_LETTERS)
+_DIACRITIC_MASK = _block_mask(DIACRITICS)
+
+# Any character followed by shadda (DOTALL: even a newline gets doubled,
+# like the old index loop did)
+_SHADDA_RE = re.compile('(.)\u0651', re.DOTALL)
+
+# Same, but never across a newline (used on newline-joined word lists)
+_SHADDA_LINE_RE = re.compile('(.)\u0651')
+
+# Runs of characters outside the Arabic block (whitespace is kept)
+_NON_ARABIC_RE = re.compile(r'[^\u0600-\u06FF\s]+')
+
+# All of DIACRITICS (shadda included) in one class, instead of one
+# str.replace() scan per diacritic. Built from the set so the two can't drift.
+_DIACRITIC_RE = re.compile('[' + re.escape(''.join(sorted(DIACRITICS))) + ']+')
+
+# Translation tables built once at import time, keyed and valued by code
+# point (ord -> ord / None) so str.translate never has to look at a str
+# object per character; a single C-level pass replaces one str.replace()
+# scan per character.
+_DIACRITIC_TABLE = {ord(d): None for d in DIACRITICS}
+
+# Hamza seats kept by conservative normalization (needed for root letters)
+_HAMZA_SEATS = frozenset({'أ', 'ؤ', 'ئ'})
+
+_AGGRESSIVE_TABLE = {
+    **{ord(k): ord(v) for k, v in NORMALIZATION_MAP.items()},
+    **_DIACRITIC_TABLE,
+}
+_CONSERVATIVE_TABLE = {
+    **{ord(k): ord(v) for k, v in NORMALIZATION_MAP.items() if k not in _HAMZA_SEATS},
+    **_DIACRITIC_TABLE,
+}
+
+# Quick check: text with none of these characters is already normalized
+# (apart from surrounding whitespace), so translate + regex can be skipped.
+def _needs_norm_re(table: dict) -> re.Pattern:
+    chars = ''.join(chr(code) for code in table)
+    return re.compile('[' + re.escape(chars) + r']|[^\u0600-\u06FF\s]')
+
+_NEEDS_AGGRESSIVE_NORM_RE = _needs_norm_re(_AGGRESSIVE_TABLE)
+_NEEDS_CONSERVATIVE_NORM_RE = _needs_norm_re(_CONSERVATIVE_TABLE)
+
+
+## Handles Shadda roots
+def expand_shadda(text: str) -> str:
+    """
+    Expand shadda (ّ) by doubling the letter before it.
+    
+    Example:
+    - "مدّ" -> "مدد"
+    - "شدّ" -> "شدد"
+    
+    Args:
+        text (str): Arabic text with shadda
+    
+    Returns:
+        str: Text with shadda expanded
+    """
+    if not text:
+        return text
+    
+    # Shadda always follows the letter it doubles: (L)ّ -> LL in one C-level pass
+    return _SHADDA_RE.sub(r'\1\1', text)
+
+
+# normalize_arabic's expand_shadda flag shadows the function inside it
+_expand_shadda = expand_shadda
+
+
+def normalize_arabic(text: str, aggressive: bool = False, expand_shadda: bool = True) -> str:
+    """
+    Normalize Arabic text with shadda expansion option.
+    
+    Args:
+        text (str): Input Arabic text
+        aggressive (bool): If True, normalize hamza and variations
+        expand_shadda (bool): If True, expand shadda to double letters
+    
+    Returns:
+        str: Normalized text
+    """
+    if not text:
+        return ""
+    needs_norm = _NEEDS_AGGRESSIVE_NORM_RE if aggressive else _NEEDS_CONSERVATIVE_NORM_RE
+    if not needs_norm.search(text):
         return text.strip()
+    return _normalize_arabic_impl(text, aggressive, expand_shadda)
+
+
+def normalize_arabic_batch(texts: List[str], aggressive: bool = False,
+                           expand_shadda: bool = True) -> List[str]:
+    """
+    Normalize a whole list of words in one call.
     
-    @staticmethod
-    def is_valid_root(root: str) -> bool:
-        """
-        Check if a string is a valid Arabic triliteral root.
-        Now handles shadda and Alif Maqsura.
-        
-        Args:
-            root (str): String to check
-            
-        Returns:
-            bool: True if valid 3-letter Arabic root
-        """
-        if not root:
-            return False
-        
-        # First expand shadda
-        normalized_root = ArabicUtils.normalize_arabic(root, aggressive=False, expand_shadda=True)
+    Same result as calling normalize_arabic() on each item, but the words
+    are joined with newlines and every step runs once over the whole
+    list (one C-level pass each) instead of once per word. The per-word
+    cache is bypassed, so big word lists don't evict hot entries.
+    
+    Args:
+        texts (List[str]): Input Arabic words
+        aggressive (bool): If True, normalize hamza and variations
+        expand_shadda (bool): If True, expand shadda to double letters
+    
+    Returns:
+        List[str]: Normalized words, in the same order
+    """
+    texts = [text or "" for text in texts]
+    if not texts:
+        return []
+    
+    table = _AGGRESSIVE_TABLE if aggressive else _CONSERVATIVE_TABLE
+    
+    if any('\n' in text for text in texts):
+        # Newline is the separator below, so fall back to word by word
+        needs_norm = (_NEEDS_AGGRESSIVE_NORM_RE if aggressive else _NEEDS_CONSERVATIVE_NORM_RE).search
+        results = []
+        for text in texts:
+            if not needs_norm(text):
+                results.append(text.strip())
+                continue
+            text = text.translate(_PRESFORM_TABLE)
+            if expand_shadda:
+                text = _expand_shadda(text)
+            results.append(_NON_ARABIC_RE.sub('', text).translate(table).strip())
+        return results
+    
+    # No step crosses or removes a newline: shadda expansion here doesn't
+    # match across "\n", so a word starting with shadda doesn't double the
+    # separator (same as normalize_arabic, where nothing precedes it)
+    blob = '\n'.join(texts).translate(_PRESFORM_TABLE)
+    if expand_shadda:
+        blob = _SHADDA_LINE_RE.sub(r'\1\1', blob)
+    blob = _NON_ARABIC_RE.sub('', blob).translate(table)
+    return [text.strip() for text in blob.split('\n')]
 
-        # Now check length - should be 3 letters after expanding shadda
-        if len(normalized_root) != 3:
-            return False
-        
-        # Check each character is an Arabic letter (ignoring diacritics)
-        for char in normalized_root:
-            if char not in ArabicUtils.ARABIC_LETTERS and not ArabicUtils.is_diacritic(char):
-                return False
-        
-        return True
+
+def is_valid_root(root: str) -> bool:
+    """
+    Check if a string is a valid Arabic triliteral root.
+    Now handles shadda and Alif Maqsura.
     
-    @staticmethod
-    def extract_possible_root(word: str, pattern_template: str) -> Optional[str]:
-        """
-        Attempt to extract root from word using pattern template.
-        
-        Args:
-            word (str): Arabic word
-            pattern_template (str): Pattern template (e.g., "1ا2و3")
-            
-        Returns:
-            Optional[str]: Extracted root or None
-        """
-        if not word or not pattern_template:
-            return None
-        
-        # Normalize both
-        word = ArabicUtils.normalize_arabic(word)
-        
-        # Create root placeholder
-        root_chars = ['', '', '']
-        
-        i, j = 0, 0
-        while i < len(word) and j < len(pattern_template):
-            if pattern_template[j] in '123':
-                root_index = int(pattern_template[j]) - 1
-                if root_index < 3:
-                    # Take the Arabic character (may be 1 or more bytes in UTF-8, but in Python string it's fine)
-                    if i < len(word):
-                        root_chars[root_index] = word[i]
-                        i += 1
-                j += 1
-            else:
-                # Skip fixed pattern character if it matches word
-                if i < len(word) and word[i] == pattern_template[j]:
-                    i += 1
-                j += 1
-        
-        # Check if we got all three root letters
-        if all(root_chars) and len(''.join(root_chars)) == 3:
-            return ''.join(root_chars)
-        
+    Args:
+        root (str): String to check
+    
+    Returns:
+        bool: True if valid 3-letter Arabic root
+    """
+    if not root:
+        return False
+    return _is_valid_root_impl(root)
+
+
+def validate_roots(roots: List[str]) -> List[bool]:
+    """
+    Check a whole list of candidate roots at once.
+    
+    Same answers as calling is_valid_root() on each item, with the
+    normalization done in one normalize_arabic_batch() call.
+    
+    Args:
+        roots (List[str]): Candidate roots
+    
+    Returns:
+        List[bool]: One flag per root, in the same order
+    """
+    is_letters = ARABIC_LETTERS.issuperset
+    return [
+        len(normalized) == 3 and is_letters(normalized)
+        for normalized in normalize_arabic_batch(roots, aggressive=False, expand_shadda=True)
+    ]
+
+
+def extract_possible_root(word: str, pattern_template: str,
+                          assume_normalized: bool = False) -> Optional[str]:
+    """
+    Attempt to extract root from word using pattern template.
+    
+    Args:
+        word (str): Arabic word
+        pattern_template (str): Pattern template (e.g., "1ا2و3")
+        assume_normalized (bool): If True, word is already the output of
+            normalize_arabic() and is used as-is
+    
+    Returns:
+        Optional[str]: Extracted root or None
+    """
+    if not word or not pattern_template:
+        return None
+    
+    # Normalize the word unless the caller already did
+    if not assume_normalized:
+        word = normalize_arabic(word)
+    
+    try:
+        ops = _compile_pattern(pattern_template)
+    except ValueError:
+        # Template cannot produce words, so it cannot explain this one
         return None
     
+    # Create root placeholder
+    root_chars = ['', '', '']
+    
+    i, n = 0, len(word)
+    for is_root, value in ops:
+        if i >= n:
+            break
+        if is_root:
+            root_chars[value] = word[i]
+            i += 1
+        elif word[i] == value:
+            # Skip fixed pattern character if it matches word
+            i += 1
+    
+    # Check if we got all three root letters
+    if all(root_chars):
+        return ''.join(root_chars)
+    
+    return None
 
-    @staticmethod
-    def apply_pattern(root: str, pattern_template: str) -> str:
-        """
-        Apply morphological pattern to root.
-        
-        Args:
-            root (str): Arabic root (3 letters, may include shadda)
-            pattern_template (str): Pattern template (e.g., "122ا3")
-            
-        Returns:
-            str: Generated word
-            
-        Examples:
-            >>> apply_pattern("كتب", "122ا3")
-            'كتّاب'
-            >>> apply_pattern("غفر", "122ا3")
-            'غفّار'
-            >>> apply_pattern("كتب", "1ا23")
-            'كاتب'
-        """
-        # Expand shadda first (in case root contains shadda)
-        expanded_root = ArabicUtils.expand_shadda(root)
-        
-        # Validate root length
-        if len(expanded_root) != 3:
-            raise ValueError(f"Root must be 3 letters after shadda expansion: {root}")
-        
-        result = []
-        
-        for char in pattern_template:
-            if char.isdigit():
-                # It's a root position indicator (1, 2, or 3)
-                root_position = int(char)
-                
-                # Validate position
-                if root_position < 1 or root_position > 3:
-                    raise ValueError(f"Invalid root position '{char}' in template. Must be 1, 2, or 3.")
-                
-                # Get the corresponding letter from root (convert to 0-based index)
-                root_idx = root_position - 1
-                result.append(expanded_root[root_idx])
-            else:
-                # It's a fixed letter (ا, و, ي, م, etc.)
-                result.append(char)
-        
-        return ''.join(result)
 
+def apply_pattern(root: str, pattern_template: str) -> str:
+    """
+    Apply morphological pattern to root.
+    
+    Args:
+        root (str): Arabic root (3 letters, may include shadda)
+        pattern_template (str): Pattern template (e.g., "122ا3")
+    
+    Returns:
+        str: Generated word
+    
+    Examples:
+        >>> apply_pattern("كتب", "122ا3")
+        'كتّاب'
+        >>> apply_pattern("غفر", "122ا3")
+        'غفّار'
+        >>> apply_pattern("كتب", "1ا23")
+        'كاتب'
+    """
+    return _apply_pattern_impl(root, pattern_template)
 
 
-    # @staticmethod
-    # def apply_pattern(root: str, pattern_template: str) -> str:
-    #     """
-    #     Apply morphological pattern to root.
-    #     Now handles roots with shadda.
-        
-    #     Args:
-    #         root (str): Arabic root (3 letters, may include shadda)
-    #         pattern_template (str): Pattern template
-            
-    #     Returns:
-    #         str: Generated word
-    #     """
-    #     # Expand shadda first
-    #     expanded_root = ArabicUtils.expand_shadda(root)
-        
-    #     # Check if valid (after shadda expansion)
-    #     if len(expanded_root) != 3:
-    #         raise ValueError(f"Root must be 3 letters after shadda expansion: {root}")
-        
-    #     result = []
-    #     i = 0  # Index in pattern template
-    #     root_index = 0  # Index in expanded root
-        
-    #     while i < len(pattern_template):
-    #         char = pattern_template[i]
-            
-    #         if char == '1':
-    #             if root_index < len(expanded_root):
-    #                 result.append(expanded_root[root_index])
-    #                 root_index += 1
-    #             i += 1
-    #         elif char == '2':
-    #             if root_index < len(expanded_root):
-    #                 result.append(expanded_root[root_index])
-    #                 root_index += 1
-    #             i += 1
-    #         elif char == '3':
-    #             if root_index < len(expanded_root):
-    #                 result.append(expanded_root[root_index])
-    #                 root_index += 1
-    #             i += 1
-    #         else:
-    #             # Check for multi-digit numbers (like 12, 23)
-    #             if char.isdigit() and i + 1 < len(pattern_template) and pattern_template[i + 1].isdigit():
-    #                 num_str = char
-    #                 while i + 1 < len(pattern_template) and pattern_template[i + 1].isdigit():
-    #                     num_str += pattern_template[i + 1]
-    #                     i += 1
-    #                 root_idx = int(num_str) - 1
-    #                 if 0 <= root_idx < len(expanded_root):
-    #                     result.append(expanded_root[root_idx])
-    #                     root_index += 1
-    #             elif char.isdigit():
-    #                 root_idx = int(char) - 1
-    #                 if 0 <= root_idx < len(expanded_root):
-    #                     result.append(expanded_root[root_idx])
-    #                     root_index += 1
-    #             else:
-    #                 result.append(char)
-    #             i += 1
-        
-    #     return ''.join(result)
+# def apply_pattern(root: str, pattern_template: str) -> str:
+#     """
+#     Apply morphological pattern to root.
+#     Now handles roots with shadda.
+    
+#     Args:
+#         root (str): Arabic root (3 letters, may include shadda)
+#         pattern_template (str): Pattern template
+        
+#     Returns:
+#         str: Generated word
+#     """
+#     # Expand shadda first
+#     expanded_root = ArabicUtils.expand_shadda(root)
+    
+#     # Check if valid (after shadda expansion)
+#     if len(expanded_root) != 3:
+#         raise ValueError(f"Root must be 3 letters after shadda expansion: {root}")
+    
+#     result = []
+#     i = 0  # Index in pattern template
+#     root_index = 0  # Index in expanded root
+    
+#     while i < len(pattern_template):
+#         char = pattern_template[i]
+        
+#         if char == '1':
+#             if root_index < len(expanded_root):
+#                 result.append(expanded_root[root_index])
+#                 root_index += 1
+#             i += 1
+#         elif char == '2':
+#             if root_index < len(expanded_root):
+#                 result.append(expanded_root[root_index])
+#                 root_index += 1
+#             i += 1
+#         elif char == '3':
+#             if root_index < len(expanded_root):
+#                 result.append(expanded_root[root_index])
+#                 root_index += 1
+#             i += 1
+#         else:
+#             # Check for multi-digit numbers (like 12, 23)
+#             if char.isdigit() and i + 1 < len(pattern_template) and pattern_template[i + 1].isdigit():
+#                 num_str = char
+#                 while i + 1 < len(pattern_template) and pattern_template[i + 1].isdigit():
+#                     num_str += pattern_template[i + 1]
+#                     i += 1
+#                 root_idx = int(num_str) - 1
+#                 if 0 <= root_idx < len(expanded_root):
+#                     result.append(expanded_root[root_idx])
+#                     root_index += 1
+#             elif char.isdigit():
+#                 root_idx = int(char) - 1
+#                 if 0 <= root_idx < len(expanded_root):
+#                     result.append(expanded_root[root_idx])
+#                     root_index += 1
+#             else:
+#                 result.append(char)
+#             i += 1
     
+#     return ''.join(result)
 
-    @staticmethod
-    def find_pattern_match(word: str, root: str, pattern_template: str) -> bool:
-        """
-        Check if word matches pattern for given root.
-        
-        Args:
-            word (str): Arabic word to check
-            root (str): Arabic root
-            pattern_template (str): Pattern template
-            
-        Returns:
-            bool: True if word matches pattern
-        """
-        try:
-            # Generate word from root and pattern
-            generated = ArabicUtils.apply_pattern(root, pattern_template)
-
-            # Use direct comparison first (most strict)
-            if word == generated:
-                return True
-            
-            # Normalize both for comparison
-            normalized_word = ArabicUtils.normalize_arabic(word, aggressive=False, expand_shadda=True)
-            normalized_generated = ArabicUtils.normalize_arabic(generated, aggressive=False, expand_shadda=True)
-            
-            # First attempt: non-aggressive normalization
-            if normalized_word == normalized_generated:
-                return True
-            
-            # Second attempt: aggressive normalization
-            aggressive_word = ArabicUtils.normalize_arabic(word, aggressive=True, expand_shadda=True)
-            aggressive_generated = ArabicUtils.normalize_arabic(generated, aggressive=True, expand_shadda=True)
-            
-            if aggressive_word == aggressive_generated:
-                # Additional check: make sure aggressive normalization didn't
-                # change the word in a way that creates false matches
-                # For example, it shouldn't reorder letters
-                if len(aggressive_word) == len(word) and len(aggressive_generated) == len(generated):
-                    return True
-    
-            
-            return False
-            
-        except Exception as e:
-            # If generation fails, it's not a match
-            return False
-    # @staticmethod
-    # def find_pattern_match(word: str, root: str, pattern_template: str) -> bool:
-    #     """
-    #     Check if word matches pattern for given root.
-    #     Uses less aggressive normalization for roots.
-        
-    #     Args:
-    #         word (str): Arabic word to check
-    #         root (str): Arabic root
-    #         pattern_template (str): Pattern template
-            
-    #     Returns:
-    #         bool: True if word matches pattern
-    #     """
-    #     # Generate word from root and pattern
-    #     generated = ArabicUtils.apply_pattern(root, pattern_template)
-        
-    #     # Use less aggressive normalization for comparison
-    #     # This preserves hamza in roots like "قرأ"
-    #     normalized_word = ArabicUtils.normalize_arabic(word, aggressive=False)
-    #     normalized_generated = ArabicUtils.normalize_arabic(generated, aggressive=False)
-        
-    #     # Also try with aggressive normalization for broader matching
-    #     if normalized_word != normalized_generated:
-    #         aggressive_word = ArabicUtils.normalize_arabic(word, aggressive=True)
-    #         aggressive_generated = ArabicUtils.normalize_arabic(generated, aggressive=True)
-    #         return aggressive_word == aggressive_generated
-        
-    #     return True
+
+def find_pattern_match(word: str, root: str, pattern_template: str) -> bool:
+    """
+    Check if word matches pattern for given root.
     
-    @staticmethod
-    def get_all_possible_roots(word: str) -> List[str]:
-        """
-        Generate all possible 3-letter roots from a word.
-        This is a simplified approach - in reality, Arabic morphology is complex.
-        
-        Args:
-            word (str): Arabic word
-            
-        Returns:
-            List[str]: List of possible roots
-        """
-        word = ArabicUtils.normalize_arabic(word)
-        possible_roots = []
-        
-        # Very simplified: take combinations of 3 letters from the word
-        # This is for demonstration only
-        if len(word) >= 3:
-            # Take first, middle, last (common pattern)
-            possible_roots.append(word[0] + word[len(word)//2] + word[-1])
-            
-            # Take first three
-            possible_roots.append(word[:3])
-            
-            # Take last three
-            possible_roots.append(word[-3:])
-        
-        # Remove duplicates and invalid roots
-        valid_roots = []
-        for root in set(possible_roots):
-            if ArabicUtils.is_valid_root(root):
-                valid_roots.append(root)
-        
-        return valid_roots
+    Args:
+        word (str): Arabic word to check
+        root (str): Arabic root
+        pattern_template (str): Pattern template
     
-    @staticmethod
-    def display_arabic_table(data: List[Tuple[str, str, str]]) -> str:
-        """
-        Format Arabic data in a readable table.
-        
-        Args:
-            data: List of tuples (root, pattern, word)
-            
-        Returns:
-            str: Formatted table string
-        """
-        if not data:
-            return "No data to display"
-        
-        # Calculate column widths
-        root_width = max(len(str(item[0])) for item in data) + 2
-        pattern_width = max(len(str(item[1])) for item in data) + 2
-        word_width = max(len(str(item[2])) for item in data) + 2
-        
-        # Create header
-        table = "=" * (root_width + pattern_width + word_width + 8) + "\n"
-        table += f"{'الجذر':<{root_width}} {'الوزن':<{pattern_width}} {'الكلمة':<{word_width}}\n"
-        table += "=" * (root_width + pattern_width + word_width + 8) + "\n"
-        
-        # Add rows
-        for root, pattern, word in data:
-            table += f"{root:<{root_width}} {pattern:<{pattern_width}} {word:<{word_width}}\n"
-        
-        table += "=" * (root_width + pattern_width + word_width + 8)
-        
-        return table
+    Returns:
+        bool: True if word matches pattern
+    """
+    return _find_pattern_match_impl(word, root, pattern_template)
+
+
+# def find_pattern_match(word: str, root: str, pattern_template: str) -> bool:
+#     """
+#     Check if word matches pattern for given root.
+#     Uses less aggressive normalization for roots.
     
-    @staticmethod
-    def preserve_hamza(text: str) -> str:
-        """
-        Preserve hamza in Arabic text.
-        
-        Args:
-            text (str): Arabic text
-            
-        Returns:
-            str: Text with preserved hamza
-        """
-        # This is a simplified approach - in reality, hamza rules are complex
-        hamza_map = {
-            'أ': 'أ',  # Alef with hamza above
-            'إ': 'إ',  # Alef with hamza below
-            'ؤ': 'ؤ',  # Waw with hamza
-            'ئ': 'ئ',  # Ya with hamza
-        }
-        
-        for plain, hamza in hamza_map.items():
-            text = text.replace(plain, hamza)
-        
-        return text
+#     Args:
+#         word (str): Arabic word to check
+#         root (str): Arabic root
+#         pattern_template (str): Pattern template
+        
+#     Returns:
+#         bool: True if word matches pattern
+#     """
+#     # Generate word from root and pattern
+#     generated = ArabicUtils.apply_pattern(root, pattern_template)
+    
+#     # Use less aggressive normalization for comparison
+#     # This preserves hamza in roots like "قرأ"
+#     normalized_word = ArabicUtils.normalize_arabic(word, aggressive=False)
+#     normalized_generated = ArabicUtils.normalize_arabic(generated, aggressive=False)
+    
+#     # Also try with aggressive normalization for broader matching
+#     if normalized_word != normalized_generated:
+#         aggressive_word = ArabicUtils.normalize_arabic(word, aggressive=True)
+#         aggressive_generated = ArabicUtils.normalize_arabic(generated, aggressive=True)
+#         return aggressive_word == aggressive_generated
     
+#     return True
 
-    ########################THIS PART IS WHERE WE HANDLE WORD GENERATION WITH ROOT TYPE (  مشتد, مثال, أجوف, ناقص, لفيف .... )########################
 
-    @staticmethod
-    def apply_pattern_with_root_type(root: str, pattern_template: str, root_analysis) -> str:
-        """
-        Apply morphological pattern considering root type.
-        
-        Args:
-            root (str): Arabic root
-            pattern_template (str): Pattern template
-            root_analysis: RootAnalysis object
-            
-        Returns:
-            str: Generated word with root type adjustments
-        """
-        # For now, use basic application
-        # We'll add special handling based on root type
-        basic_result = ArabicUtils.apply_pattern(root, pattern_template)
-        
-        # Apply adjustments based on root type
-        adjusted_result = ArabicUtils._adjust_for_root_type(
-            basic_result, root, pattern_template, root_analysis
-        )
-        
-        return adjusted_result
+def find_pattern_match_many(words: List[str], root: str, pattern_template: str) -> List[bool]:
+    """
+    Check many words against one (root, pattern) pair.
     
-    @staticmethod
-    def _adjust_for_root_type(word: str, root: str, pattern: str, analysis) -> str:
-        """
-        Adjust generated word based on root type.
-        
-        Args:
-            word (str): Basic generated word
-            root (str): Arabic root
-            pattern (str): Pattern template
-            analysis: RootAnalysis object
-            
-        Returns:
-            str: Adjusted word
-        """
-        # Default: no adjustment
-        adjusted = word
-        
-        # Handle hollow roots (أجوف)
-        if "أجوف" in analysis.subtype:
-            # Middle letter is weak (و/ي/ا)
-            # In many patterns, it changes or disappears
-            if pattern == "1ا23":  # فاعل pattern
-                # Example: قال -> قائل (و becomes ء on ا)
-                if root[1] in ['و', 'ي']:
-                    # Replace middle with hamza on alif
-                    adjusted = root[0] + 'ائ' + root[2]
-            
-            elif pattern == "123":  # فعل pattern (past tense)
-                # Hollow root in past tense: و/ي becomes ا
-                if root[1] in ['و', 'ي']:
-                    adjusted = root[0] + 'ا' + root[2]
-        
-        # Handle defective roots (ناقص)
-        elif "ناقص" in analysis.subtype:
-            # Final letter is weak
-            if pattern in ["1ا23", "12ا3"]:
-                # Final weak letter often becomes ي
-                if root[2] in ['و', 'ا', 'ى']:
-                    adjusted = word[:-1] + 'ي'
+    The word is generated and normalized once, outside the loop; each
+    result is the same as find_pattern_match(word, root, pattern_template).
+    
+    Args:
+        words (List[str]): Arabic words to check
+        root (str): Arabic root
+        pattern_template (str): Pattern template
+    
+    Returns:
+        List[bool]: One flag per word, in the same order
+    """
+    words = list(words)
+    try:
+        generated = apply_pattern(root, pattern_template)
+    except ValueError:
+        return [False] * len(words)
+    
+    aggressive_generated = normalize_arabic(generated, aggressive=True, expand_shadda=True)
+    normalized_generated = normalize_arabic(generated, aggressive=False, expand_shadda=True)
+    generated_same_length = len(aggressive_generated) == len(generated)
+    
+    results = []
+    for word in words:
+        if word == generated:
+            results.append(True)
+            continue
+        aggressive_word = normalize_arabic(word, aggressive=True, expand_shadda=True)
+        if aggressive_word != aggressive_generated:
+            results.append(False)
+        elif normalize_arabic(word, aggressive=False, expand_shadda=True) == normalized_generated:
+            results.append(True)
+        else:
+            results.append(len(aggressive_word) == len(word) and generated_same_length)
+    return results
+
+
+def find_pattern_match_batch(words: List[str], roots: List[str],
+                             pattern_templates: List[str]) -> List[bool]:
+    """
+    Check many (word, root, template) triples given as parallel lists.
+    
+    Args:
+        words (List[str]): Arabic words to check
+        roots (List[str]): Arabic roots
+        pattern_templates (List[str]): Pattern templates
+    
+    Returns:
+        List[bool]: find_pattern_match() result for each position
+    """
+    return list(map(_find_pattern_match_impl, words, roots, pattern_templates))
+
+
+def get_all_possible_roots(word: str) -> List[str]:
+    """
+    Generate all possible 3-letter roots from a word.
+    This is a simplified approach - in reality, Arabic morphology is complex.
+    
+    Args:
+        word (str): Arabic word
+    
+    Returns:
+        List[str]: List of possible roots
+    """
+    word = normalize_arabic(word)
+    if len(word) < 3:
+        return []
+    
+    # Very simplified: first/middle/last, first three, last three.
+    # Candidates are 3-char slices of an already normalized word (no
+    # diacritics, no shadda), so validity is just "all three are letters";
+    # with at most 3 candidates a list dedupes cheaper than a set
+    valid_roots = []
+    for root in (word[0] + word[len(word)//2] + word[-1], word[:3], word[-3:]):
+        if root not in valid_roots and ARABIC_LETTERS.issuperset(root):
+            valid_roots.append(root)
+    
+    return valid_roots
+
+
+def display_arabic_table(data: List[Tuple[str, str, str]]) -> str:
+    """
+    Format Arabic data in a readable table.
+    
+    Args:
+        data: List of tuples (root, pattern, word)
+    
+    Returns:
+        str: Formatted table string
+    """
+    if not data:
+        return "No data to display"
+    
+    roots, patterns, words = zip(*data)
+    return display_arabic_table_soa(roots, patterns, words)
+
+
+def display_arabic_table_soa(roots: List[str], patterns: List[str], words: List[str]) -> str:
+    """
+    Format Arabic data given as three parallel columns.
+    
+    Args:
+        roots: Root column
+        patterns: Pattern column
+        words: Word column
+    
+    Returns:
+        str: Formatted table string
+    """
+    if not roots:
+        return "No data to display"
+    
+    # Column widths: each max() runs over a C-level map
+    root_width = max(map(len, map(str, roots))) + 2
+    pattern_width = max(map(len, map(str, patterns))) + 2
+    word_width = max(map(len, map(str, words))) + 2
+    
+    separator = "=" * (root_width + pattern_width + word_width + 8)
+    
+    lines = [
+        separator,
+        f"{'الجذر':<{root_width}} {'الوزن':<{pattern_width}} {'الكلمة':<{word_width}}",
+        separator,
+    ]
+    lines += [
+        f"{root:<{root_width}} {pattern:<{pattern_width}} {word:<{word_width}}"
+        for root, pattern, word in zip(roots, patterns, words)
+    ]
+    lines.append(separator)
+    
+    return "\n".join(lines)
+
+
+def preserve_hamza(text: str) -> str:
+    """
+    Preserve hamza in Arabic text.
+    
+    Args:
+        text (str): Arabic text
+    
+    Returns:
+        str: Text with preserved hamza
+    """
+    # Hamza letters are already kept as-is by conservative normalization,
+    # so there is nothing to rewrite here
+    return text
+
+
+########################THIS PART IS WHERE WE HANDLE WORD GENERATION WITH ROOT TYPE (  مشتد, مثال, أجوف, ناقص, لفيف .... )########################
+
+def apply_pattern_with_root_type(root: str, pattern_template: str, root_analysis) -> str:
+    """
+    Apply morphological pattern considering root type.
+    
+    Args:
+        root (str): Arabic root
+        pattern_template (str): Pattern template
+        root_analysis: RootAnalysis object
+    
+    Returns:
+        str: Generated word with root type adjustments
+    """
+    # For now, use basic application
+    # We'll add special handling based on root type
+    basic_result = apply_pattern(root, pattern_template)
+    
+    # Apply adjustments based on root type
+    adjusted_result = _adjust_for_root_type(
+        basic_result, root, pattern_template, root_analysis
+    )
+    
+    return adjusted_result
+
+
+def _adjust_for_root_type(word: str, root: str, pattern: str, analysis) -> str:
+    """
+    Adjust generated word based on root type.
+    
+    Args:
+        word (str): Basic generated word
+        root (str): Arabic root
+        pattern (str): Pattern template
+        analysis: RootAnalysis object
+    
+    Returns:
+        str: Adjusted word
+    """
+    # Hollow / defective roots: one dict lookup on (root type, pattern)
+    adjust = _ROOT_TYPE_ADJUSTMENTS.get((_subtype_kind(analysis.subtype), pattern))
+    if adjust is not None:
+        return adjust(word, root)
+    
+    # Default: no adjustment. Hamzated roots need none either: apply_pattern
+    # already keeps the hamza seat of the root letters as-is
+    return word
+
+
+# Weak letters that trigger the adjustments below
+_WEAK_MIDDLE_LETTERS = frozenset({'و', 'ي'})
+_WEAK_FINAL_LETTERS = frozenset({'و', 'ا', 'ى'})
+
+
+@lru_cache(maxsize=64)
+def _subtype_kind(subtype: Optional[str]) -> Optional[str]:
+    """Reduce a root subtype to "أجوف" / "ناقص" (or None) once per subtype."""
+    if not subtype:
+        return None
+    if "أجوف" in subtype:
+        return "أجوف"
+    if "ناقص" in subtype:
+        return "ناقص"
+    return None
+
+
+def _adjust_hollow_active_participle(word: str, root: str) -> str:
+    # Example: قال -> قائل (و becomes ء on ا)
+    if root[1] in _WEAK_MIDDLE_LETTERS:
+        # Replace middle with hamza on alif
+        return f'{root[0]}ائ{root[2]}'
+    return word
+
+
+def _adjust_hollow_past(word: str, root: str) -> str:
+    # Hollow root in past tense: و/ي becomes ا
+    if root[1] in _WEAK_MIDDLE_LETTERS:
+        return f'{root[0]}ا{root[2]}'
+    return word
+
+
+def _adjust_defective(word: str, root: str) -> str:
+    # Final weak letter often becomes ي
+    if root[2] in _WEAK_FINAL_LETTERS:
+        return f'{word[:-1]}ي'
+    return word
+
+
+# (root type, pattern template) -> adjustment
+_ROOT_TYPE_ADJUSTMENTS = {
+    ("أجوف", "1ا23"): _adjust_hollow_active_participle,  # فاعل pattern
+    ("أجوف", "123"): _adjust_hollow_past,                 # فعل pattern (past tense)
+    ("ناقص", "1ا23"): _adjust_defective,
+    ("ناقص", "12ا3"): _adjust_defective,
+}
+
+
+def is_arabic_letter(char: str) -> bool:
+    """Check if character is one of ARABIC_LETTERS."""
+    if len(char) != 1:
+        return False
+    offset = ord(char) - _ARABIC_BLOCK_START
+    return 0 <= offset < 0x100 and _LETTER_MASK[offset] == 1
+
+
+def is_diacritic(char: str) -> bool:
+    """Check if character is a diacritic."""
+    # Direct byte lookup in the Arabic block (DIACRITICS includes shadda)
+    if len(char) != 1:
+        return False
+    offset = ord(char) - _ARABIC_BLOCK_START
+    return 0 <= offset < 0x100 and _DIACRITIC_MASK[offset] == 1
+
+
+def strip_diacritics(text: str) -> str:
+    """
+    Remove diacritics only (no shadda expansion, no letter unification).
+    
+    Args:
+        text (str): Arabic text
+    
+    Returns:
+        str: Text without tashkeel
+    """
+    if not text:
+        return ""
+    return _DIACRITIC_RE.sub('', text)
+
+
+# Cached implementations behind the pure string->string helpers. The same
+# (word,), (root, template) tuples recur constantly while analysing a corpus,
+# so repeated calls become a dict lookup instead of re-scanning strings.
+
+@lru_cache(maxsize=131072)
+def _normalize_arabic_impl(text: str, aggressive: bool, expand_shadda: bool) -> str:
+    """Cached body of normalize_arabic()."""
+    # Fold presentation forms back to base letters before anything else
+    text = text.translate(_PRESFORM_TABLE)
+    
+    # Expand shadda first if requested (must see the original neighbours,
+    # so it runs before anything is removed)
+    if expand_shadda:
+        text = _expand_shadda(text)
+    
+    # Remove non-Arabic characters early so translate runs on less text;
+    # every table key and value is inside the Arabic block, so the two
+    # steps give the same result in either order
+    text = _NON_ARABIC_RE.sub('', text)
+    
+    # Remove diacritics and unify letter variants in a single pass
+    # (aggressive also folds hamza seats, conservative preserves them)
+    text = text.translate(_AGGRESSIVE_TABLE if aggressive else _CONSERVATIVE_TABLE)
+    
+    return text.strip()
+
+
+@lru_cache(maxsize=65536)
+def _is_valid_root_impl(root: str) -> bool:
+    """Cached body of is_valid_root()."""
+    # First expand shadda
+    normalized_root = normalize_arabic(root, aggressive=False, expand_shadda=True)
+    
+    # Should be 3 letters after expanding shadda; normalization has
+    # already stripped diacritics, so every char must be a letter
+    return len(normalized_root) == 3 and ARABIC_LETTERS.issuperset(normalized_root)
+
+
+@lru_cache(maxsize=65536)
+def _apply_pattern_impl(root: str, pattern_template: str) -> str:
+    """Cached body of apply_pattern()."""
+    # Expand shadda first (in case root contains shadda); plain roots are
+    # used as-is and passed straight to the generated function below
+    expanded_root = expand_shadda(root) if '\u0651' in root else root
+    
+    # Validate root length
+    if len(expanded_root) != 3:
+        raise ValueError(f"Root must be 3 letters after shadda expansion: {root}")
+    
+    return _compile_pattern_function(pattern_template)(expanded_root)
+
+
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern_template: str) -> Tuple[Tuple[int, object], ...]:
+    """
+    Parse a pattern template once into a tuple of operations.
+    
+    Each entry is (0, literal) for a fixed letter or (1, root_index) for a
+    root position, e.g. "1ا23" -> ((1, 0), (0, 'ا'), (1, 1), (1, 2)).
+    
+    Raises:
+        ValueError: If the template uses a root position other than 1, 2, 3
+    """
+    ops = []
+    for char in pattern_template:
+        if char.isdigit():
+            # It's a root position indicator (1, 2, or 3)
+            root_position = int(char)
+            if root_position < 1 or root_position > 3:
+                raise ValueError(f"Invalid root position '{char}' in template. Must be 1, 2, or 3.")
+            ops.append((1, root_position - 1))
+        else:
+            # It's a fixed letter (ا, و, ي, م, etc.)
+            ops.append((0, char))
+    return tuple(ops)
+
+
+@lru_cache(maxsize=1024)
+def _compile_pattern_function(pattern_template: str) -> Callable[[str], str]:
+    """
+    Generate a dedicated function for a template, e.g. "1ا23" ->
+    lambda r: r[0] + 'ا' + r[1] + r[2].
+    
+    Root indices and literals are baked into the code, so filling the
+    template is plain indexing and concatenation with no per-char checks.
+    Literals go through repr(), so any template text is safe to inline.
+    """
+    parts = ['r[%d]' % v if k else repr(v) for k, v in _compile_pattern(pattern_template)]
+    return eval('lambda r: ' + (' + '.join(parts) or "''"))
+
+
+@lru_cache(maxsize=65536)
+def _find_pattern_match_impl(word: str, root: str, pattern_template: str) -> bool:
+    """Cached body of find_pattern_match()."""
+    try:
+        # Generate word from root and pattern
+        generated = apply_pattern(root, pattern_template)
+        
+        # Use direct comparison first (most strict)
+        if word == generated:
+            return True
+        
+        # Aggressive normalization folds everything conservative does (plus
+        # hamza seats), so if the aggressive forms differ nothing can match.
+        # Checking it first skips the second normalization for most pairs.
+        aggressive_word = normalize_arabic(word, aggressive=True, expand_shadda=True)
+        aggressive_generated = normalize_arabic(generated, aggressive=True, expand_shadda=True)
+        if aggressive_word != aggressive_generated:
+            return False
         
-        # Handle hamzated roots (مهموز)
-        elif analysis.category == RootCategory.HAMZATED:
-            # Preserve hamza properly
-            adjusted = ArabicUtils.preserve_hamza(word)
+        # Non-aggressive normalization (hamza preserved)
+        normalized_word = normalize_arabic(word, aggressive=False, expand_shadda=True)
+        normalized_generated = normalize_arabic(generated, aggressive=False, expand_shadda=True)
+        if normalized_word == normalized_generated:
+            return True
         
-        return adjusted
+        # Only the aggressive forms match: make sure aggressive normalization
+        # didn't change the word in a way that creates false matches
+        return len(aggressive_word) == len(word) and len(aggressive_generated) == len(generated)
+    
+    except ValueError:
+        # Root or template can't generate a word, so it's not a match
+        return False
+
+
+class ArabicUtils:
+    """Utilities for handling Arabic text in morphological processing.
+    
+    Thin namespace over the module-level functions, kept so existing
+    ``ArabicUtils.normalize_arabic(...)`` callers keep working.
+    """
+    
+    ARABIC_LETTERS = ARABIC_LETTERS
+    NORMALIZATION_MAP = NORMALIZATION_MAP
+    DIACRITICS = DIACRITICS
     
-    @staticmethod
-    def is_diacritic(char: str) -> bool:
-        """Check if character is a diacritic."""
-        return char in ArabicUtils.DIACRITICS or char == '\u0651'  # Include shadda
\ No newline at end of file
+    expand_shadda = staticmethod(expand_shadda)
+    normalize_arabic = staticmethod(normalize_arabic)
+    normalize_arabic_batch = staticmethod(normalize_arabic_batch)
+    is_valid_root = staticmethod(is_valid_root)
+    validate_roots = staticmethod(validate_roots)
+    extract_possible_root = staticmethod(extract_possible_root)
+    apply_pattern = staticmethod(apply_pattern)
+    find_pattern_match = staticmethod(find_pattern_match)
+    find_pattern_match_many = staticmethod(find_pattern_match_many)
+    find_pattern_match_batch = staticmethod(find_pattern_match_batch)
+    get_all_possible_roots = staticmethod(get_all_possible_roots)
+    display_arabic_table = staticmethod(display_arabic_table)
+    display_arabic_table_soa = staticmethod(display_arabic_table_soa)
+    preserve_hamza = staticmethod(preserve_hamza)
+    apply_pattern_with_root_type = staticmethod(apply_pattern_with_root_type)
+    _adjust_for_root_type = staticmethod(_adjust_for_root_type)
+    is_arabic_letter = staticmethod(is_arabic_letter)
+    is_diacritic = staticmethod(is_diacritic)
+    strip_diacritics = staticmethod(strip_diacritics)
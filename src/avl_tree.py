@@ -17,6 +17,8 @@ from arabic_utils import ArabicUtils
 class AVLNode:
     """Node in AVL Tree storing an Arabic root."""
     
+    __slots__ = ('root', 'derivatives', 'frequency', 'left', 'right', 'height', 'balance')
+    
     def __init__(self, root: str):
         """
         Initialize an AVL node.
@@ -25,11 +27,12 @@ class AVLNode:
             root (str): Arabic root (3 letters, e.g., "كتب")
         """
         self.root = root  # The Arabic root
-        self.derivatives = []  # List of validated derived words
+        self.derivatives = {}  # (word, pattern) -> validated derivative entry
         self.frequency = 1  # Usage frequency (optional feature)
         self.left = None    # Left child
         self.right = None   # Right child
         self.height = 1     # Height of node (for balancing)
+        self.balance = 0    # Balance factor: height(left) - height(right)
 
     def add_derivative(self, word: str, pattern: str) -> None:
         """
@@ -40,21 +43,22 @@ class AVLNode:
             pattern (str): Pattern used to generate it
         """
         # Check if this word already exists for this root
-        for existing in self.derivatives:
-            if existing['word'] == word and existing['pattern'] == pattern:
-                existing['frequency'] += 1
-                return
+        key = (word, pattern)
+        existing = self.derivatives.get(key)
+        if existing is not None:
+            existing['frequency'] += 1
+            return
         
         # Add new derivative
-        self.derivatives.append({
+        self.derivatives[key] = {
             'word': word,
             'pattern': pattern,
             'frequency': 1
-        })
+        }
 
     def get_derivatives(self) -> list:
-        """Get all derivatives for this root."""
-        return self.derivatives
+        """Get all derivatives for this root (in insertion order)."""
+        return list(self.derivatives.values())
     
     def get_derivative_count(self) -> int:
         """Get number of derivatives for this root."""
@@ -72,19 +76,15 @@ class AVLNode:
         Returns:
             bool: True if removed, False if not found
         """
-        removed = False
-        indices_to_remove = []
+        if pattern is not None:
+            return self.derivatives.pop((word, pattern), None) is not None
         
-        for i, deriv in enumerate(self.derivatives):
-            if deriv['word'] == word and (pattern is None or deriv['pattern'] == pattern):
-                indices_to_remove.append(i)
-                removed = True
+        # No pattern given: drop every entry for this word
+        keys_to_remove = [key for key in self.derivatives if key[0] == word]
+        for key in keys_to_remove:
+            del self.derivatives[key]
         
-        # Remove from highest index to lowest to avoid shifting issues
-        for i in sorted(indices_to_remove, reverse=True):
-            del self.derivatives[i]
-        
-        return removed
+        return bool(keys_to_remove)
     
     def clear_derivatives(self) -> None:
         """Clear all derivatives for this root."""
@@ -97,11 +97,16 @@ class AVLTree:
     def __init__(self):
         """Initialize empty AVL tree."""
         self.root = None
+        self._stats_cache = None    # In-order roots/nodes, rebuilt lazily
+        self._node_index = {}       # root -> AVLNode for O(1) lookup
     
     def insert(self, root: str) -> None:
         """
         Public method to insert a new Arabic root.
         
+        The root is stored normalized (conservative, shadda expanded), so
+        everything read back from the tree can skip normalization.
+        
         Args:
             root (str): Arabic root to insert (3 letters)
         """
@@ -118,97 +123,195 @@ class AVLTree:
     
     def _insert(self, node: AVLNode, root: str) -> AVLNode:
         """
-        Recursively insert a root and balance the tree.
+        Insert a root and balance the tree, iteratively.
+        
+        Walks down once recording the path, then retraces it bottom-up
+        updating heights/balances and rotating where needed. Retracing
+        stops as soon as a subtree keeps its old height, since nothing
+        above it can change.
         
         Args:
-            node (AVLNode): Current node
+            node (AVLNode): Root of the (sub)tree to insert into
             root (str): Arabic root to insert
             
         Returns:
-            AVLNode: Updated node after insertion and balancing
+            AVLNode: Updated (sub)tree root after insertion and balancing
         """
         # Step 1: Perform normal BST insertion
         if node is None:
-            return AVLNode(root)
-        
-        # Compare Arabic roots lexicographically
-        if root < node.root:
-            node.left = self._insert(node.left, root)
-        elif root > node.root:
-            node.right = self._insert(node.right, root)
-        else:
-            # Root already exists - update frequency or do nothing
-            node.frequency += 1
-            return node
-        
-        # Step 2: Update height of current node
-        node.height = 1 + max(self._get_height(node.left), 
-                             self._get_height(node.right))
-        
-        # Step 3: Get balance factor
-        balance = self._get_balance(node)
-        
-        # Step 4: If unbalanced, handle 4 cases
-        
-        # Left Left Case
-        if balance > 1 and root < node.left.root:
-            return self._right_rotate(node)
-        
-        # Right Right Case
-        if balance < -1 and root > node.right.root:
-            return self._left_rotate(node)
-        
-        # Left Right Case
-        if balance > 1 and root > node.left.root:
-            node.left = self._left_rotate(node.left)
-            return self._right_rotate(node)
-        
-        # Right Left Case
-        if balance < -1 and root < node.right.root:
-            node.right = self._right_rotate(node.right)
-            return self._left_rotate(node)
-        
-        return node
+            return self._new_node(root)
+        
+        path = []  # (ancestor, went_left) from the top down
+        current = node
+        while True:
+            # Compare Arabic roots lexicographically
+            key = current.root
+            if root == key:
+                # Root already exists - update frequency or do nothing
+                current.frequency += 1
+                return node
+            went_left = root < key
+            path.append((current, went_left))
+            child = current.left if went_left else current.right
+            if child is None:
+                if went_left:
+                    current.left = self._new_node(root)
+                else:
+                    current.right = self._new_node(root)
+                break
+            current = child
+        
+        # Steps 2-4: retrace the path bottom-up
+        subtree = None  # Rebalanced child subtree to re-attach to its parent
+        for depth in range(len(path) - 1, -1, -1):
+            ancestor, went_left = path[depth]
+            if subtree is not None:
+                if went_left:
+                    ancestor.left = subtree
+                else:
+                    ancestor.right = subtree
+            
+            old_height = ancestor.height
+            self._update_node(ancestor)
+            balance = ancestor.balance
+            
+            if balance > 1:
+                # Left Right Case: first rotate the left child
+                if root > ancestor.left.root:
+                    ancestor.left = self._left_rotate(ancestor.left)
+                # Left Left Case
+                subtree = self._right_rotate(ancestor)
+            elif balance < -1:
+                # Right Left Case: first rotate the right child
+                if root < ancestor.right.root:
+                    ancestor.right = self._right_rotate(ancestor.right)
+                # Right Right Case
+                subtree = self._left_rotate(ancestor)
+            elif ancestor.height == old_height:
+                # Height unchanged: ancestors above are unaffected
+                return node
+            else:
+                subtree = ancestor
+        
+        return subtree
+    
+    def _new_node(self, root: str) -> AVLNode:
+        """Create a node for a new root and register it in the index."""
+        new_node = AVLNode(root)
+        self._node_index[root] = new_node
+        self._stats_cache = None
+        return new_node
     
     def search(self, root: str) -> AVLNode:
         """
         Search for an Arabic root in the tree.
         
+        Served from the root -> node index kept by insert, so read-heavy
+        phases never walk the node links; _search walks them explicitly.
+        
         Args:
             root (str): Arabic root to search for
             
         Returns:
             AVLNode: Node containing the root, or None if not found
         """
-        return self._search(self.root, root)
+        return self._node_index.get(root)
+    
+    def lookup(self, root: str) -> AVLNode:
+        """
+        Find the node of an already-normalized root in O(1).
+        
+        Args:
+            root (str): Arabic root exactly as stored in the tree
+            
+        Returns:
+            AVLNode: Node containing the root, or None if not found
+        """
+        return self._node_index.get(root)
     
     def _search(self, node: AVLNode, root: str) -> AVLNode:
-        """Recursive search helper."""
-        if node is None or node.root == root:
-            return node
-        
-        if root < node.root:
-            return self._search(node.left, root)
-        else:
-            return self._search(node.right, root)
+        """Iterative search helper (walks down from node without recursion)."""
+        while node is not None:
+            key = node.root
+            if root == key:
+                return node
+            node = node.left if root < key else node.right
+        return None
     
     def display_inorder(self) -> list:
         """
         Return all roots in sorted order (in-order traversal).
         
+        The list is cached until the next insertion of a new root;
+        callers must not modify it.
+        
         Returns:
             list: Sorted list of Arabic roots
         """
-        result = []
-        self._inorder_traversal(self.root, result)
-        return result
+        return self._structure_stats()['roots']
     
-    def _inorder_traversal(self, node: AVLNode, result: list) -> None:
-        """Recursive in-order traversal."""
-        if node:
-            self._inorder_traversal(node.left, result)
-            result.append(node.root)
-            self._inorder_traversal(node.right, result)
+    def _structure_stats(self) -> dict:
+        """
+        Collect everything that only changes on insertion in one in-order walk.
+        
+        Cached until the next insertion of a new root.
+        
+        Returns:
+            dict: 'count', 'height', 'roots' (sorted) and 'nodes' (same order)
+        """
+        stats = self._stats_cache
+        if stats is not None:
+            return stats
+        
+        roots = []
+        nodes = []
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            roots.append(node.root)
+            nodes.append(node)
+            node = node.right
+        
+        stats = {
+            'count': len(nodes),
+            'height': self._get_height(self.root),
+            'roots': roots,
+            'nodes': nodes
+        }
+        self._stats_cache = stats
+        return stats
+    
+    def get_tree_stats(self) -> dict:
+        """
+        Get tree and derivative statistics from a single traversal.
+        
+        The structural part is cached (see _structure_stats); derivative
+        counts are recomputed on each call, since derivatives are added to
+        nodes directly.
+        
+        Returns:
+            dict: 'count', 'height', 'roots', 'nodes', 'with_derivatives',
+                  'without_derivatives', 'total_derivatives'
+        """
+        stats = self._structure_stats()
+        with_derivatives = 0
+        total_derivatives = 0
+        for node in stats['nodes']:
+            derivative_count = len(node.derivatives)
+            if derivative_count:
+                with_derivatives += 1
+                total_derivatives += derivative_count
+        
+        return {
+            **stats,
+            'with_derivatives': with_derivatives,
+            'without_derivatives': stats['count'] - with_derivatives,
+            'total_derivatives': total_derivatives
+        }
     
     # ========== AVL HELPER METHODS ==========
     
@@ -218,11 +321,13 @@ class AVLTree:
             return 0
         return node.height
     
-    def _get_balance(self, node: AVLNode) -> int:
-        """Get balance factor of node."""
-        if node is None:
-            return 0
-        return self._get_height(node.left) - self._get_height(node.right)
+    def _update_node(self, node: AVLNode) -> None:
+        """Recompute height and stored balance factor from the children."""
+        left, right = node.left, node.right
+        left_height = left.height if left is not None else 0
+        right_height = right.height if right is not None else 0
+        node.height = 1 + (left_height if left_height > right_height else right_height)
+        node.balance = left_height - right_height
     
     def _right_rotate(self, y: AVLNode) -> AVLNode:
         r"""
@@ -241,11 +346,9 @@ class AVLTree:
         x.right = y
         y.left = T2
         
-        # Update heights
-        y.height = 1 + max(self._get_height(y.left), 
-                          self._get_height(y.right))
-        x.height = 1 + max(self._get_height(x.left), 
-                          self._get_height(x.right))
+        # Update heights and balance factors (child first)
+        self._update_node(y)
+        self._update_node(x)
         
         return x
     
@@ -266,11 +369,9 @@ class AVLTree:
         y.left = x
         x.right = T2
         
-        # Update heights
-        x.height = 1 + max(self._get_height(x.left), 
-                          self._get_height(x.right))
-        y.height = 1 + max(self._get_height(y.left), 
-                          self._get_height(y.right))
+        # Update heights and balance factors (child first)
+        self._update_node(x)
+        self._update_node(y)
         
         return y
     
@@ -280,31 +381,19 @@ class AVLTree:
     
     def count_nodes(self) -> int:
         """Count total nodes in the tree."""
-        return self._count_nodes(self.root)
-    
-    def _count_nodes(self, node: AVLNode) -> int:
-        """Recursive node counter."""
-        if node is None:
-            return 0
-        return 1 + self._count_nodes(node.left) + self._count_nodes(node.right)
+        return self._structure_stats()['count']
     
     def get_all_nodes(self) -> list[AVLNode]:
         """
-        Get all nodes in the tree.
+        Get all nodes in the tree (in-order).
+        
+        The list is cached until the next insertion of a new root;
+        callers must not modify it.
         
         Returns:
             List[AVLNode]: List of all nodes
         """
-        nodes = []
-        self._collect_nodes(self.root, nodes)
-        return nodes
-    
-    def _collect_nodes(self, node: AVLNode, nodes_list: list[AVLNode]) -> None:
-        """Recursively collect all nodes."""
-        if node:
-            self._collect_nodes(node.left, nodes_list)
-            nodes_list.append(node)
-            self._collect_nodes(node.right, nodes_list)
+        return self._structure_stats()['nodes']
 
     def remove_derivative(self, root: str, word: str, pattern: str = None) -> bool:
         """
@@ -338,35 +427,82 @@ class AVLTree:
         """
         return self._get_node_structure(self.root)
     
+    def iter_tree_structure(self):
+        """
+        Stream the tree structure in pre-order without building nested dicts.
+        
+        Yields:
+            tuple: (depth, root, height, balance, derivative_count, frequency)
+                   for each node, the tree root at depth 0
+        """
+        stack = [(self.root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if node is None:
+                continue
+            yield (depth, node.root, node.height, node.balance,
+                   len(node.derivatives), node.frequency)
+            stack.append((node.right, depth + 1))
+            stack.append((node.left, depth + 1))
+    
     def _get_node_structure(self, node: AVLNode) -> dict:
-        """Recursively get node structure."""
+        """
+        Get node structure iteratively.
+        
+        Nodes are visited parent-first; each dict is linked into its
+        parent's 'left'/'right' slot as soon as it is built.
+        """
         if node is None:
             return None
         
-        return {
-            'root': node.root,
-            'height': node.height,
-            'balance': self._get_balance(node),
-            'derivative_count': node.get_derivative_count(),
-            'frequency': node.frequency,
-            'left': self._get_node_structure(node.left),
-            'right': self._get_node_structure(node.right)
-        }
+        top = {}
+        stack = [(node, top, None)]
+        while stack:
+            current, parent, side = stack.pop()
+            entry = {
+                'root': current.root,
+                'height': current.height,
+                'balance': current.balance,
+                'derivative_count': current.get_derivative_count(),
+                'frequency': current.frequency,
+                'left': None,
+                'right': None
+            }
+            if side is None:
+                top = entry
+            else:
+                parent[side] = entry
+            if current.right:
+                stack.append((current.right, entry, 'right'))
+            if current.left:
+                stack.append((current.left, entry, 'left'))
+        return top
     
-    def display_tree_ascii(self) -> str:
+    def display_tree_ascii(self, out=None) -> str:
         """
         Display tree in ASCII format (sideways, rotated 90°).
         
+        Args:
+            out: Optional text stream (file, io.StringIO, ...); when given,
+                 the lines are written to it one by one instead of being
+                 joined into a string
+        
         Returns:
-            str: ASCII representation of the tree
+            str: ASCII representation of the tree ("" when written to out)
         """
-        lines = []
-        self._generate_ascii_tree(self.root, "", True, lines)
-        return "\n".join(lines)
+        lines = self._iter_ascii_lines(self.root, "", True)
+        if out is None:
+            return "\n".join(lines)
+        
+        for i, line in enumerate(lines):
+            if i:
+                out.write("\n")
+            out.write(line)
+        return ""
     
     def _generate_ascii_tree(self, node: AVLNode, prefix: str, is_left: bool, lines: list) -> None:
         """
-        Generate ASCII tree representation recursively.
+        Generate ASCII tree representation into a list of lines.
         
         Args:
             node: Current node
@@ -374,31 +510,43 @@ class AVLTree:
             is_left: Whether this node is a left child
             lines: List to accumulate lines
         """
-        if node is None:
-            return
+        lines.extend(self._iter_ascii_lines(node, prefix, is_left))
+    
+    def _iter_ascii_lines(self, node: AVLNode, prefix: str, is_left: bool):
+        """
+        Yield the ASCII tree lines using an explicit stack.
+        
+        Each stack entry is (node, prefix, is_left, phase): phase 0 expands
+        the node (right subtree first), phase 1 emits its own line.
         
-        # Add right subtree
-        self._generate_ascii_tree(
-            node.right, 
-            prefix + ("│   " if is_left else "    "), 
-            False, 
-            lines
-        )
-        
-        # Add current node
-        line = prefix + ("└── " if is_left else "┌── ") + node.root
-        line += f" (h={node.height}, bal={self._get_balance(node)})"
-        if node.get_derivative_count() > 0:
-            line += f" [Derivatives: {node.get_derivative_count()}]"
-        lines.append(line)
-        
-        # Add left subtree
-        self._generate_ascii_tree(
-            node.left, 
-            prefix + ("    " if is_left else "│   "), 
-            True, 
-            lines
-        )
+        Args:
+            node: Current node
+            prefix: Prefix string for this line
+            is_left: Whether this node is a left child
+        
+        Yields:
+            str: One line per node, top to bottom
+        """
+        stack = [(node, prefix, is_left, 0)]
+        while stack:
+            current, prefix, is_left, phase = stack.pop()
+            if current is None:
+                continue
+            
+            if phase == 1:
+                # Emit current node as a single formatted string
+                branch = "└── " if is_left else "┌── "
+                count = len(current.derivatives)
+                if count:
+                    yield f"{prefix}{branch}{current.root} (h={current.height}, bal={current.balance}) [Derivatives: {count}]"
+                else:
+                    yield f"{prefix}{branch}{current.root} (h={current.height}, bal={current.balance})"
+                continue
+            
+            # Pushed in reverse: right subtree, current node, left subtree
+            stack.append((current.left, prefix + ("    " if is_left else "│   "), True, 0))
+            stack.append((current, prefix, is_left, 1))
+            stack.append((current.right, prefix + ("│   " if is_left else "    "), False, 0))
     
     def display_tree_horizontal(self) -> str:
         """
@@ -412,23 +560,39 @@ class AVLTree:
             return "🌳 Empty tree"
         
         result = []
+        # Each level holds real nodes and ints; an int is a run of that
+        # many empty slots, so missing subtrees cost O(1) instead of O(2^h)
         current_level = [self.root]
+        has_nodes = True
         
-        while any(node is not None for node in current_level):
+        while has_nodes:
             # Print current level
-            level_str = ""
+            parts = []
             next_level = []
+            empty_run = 0
+            has_nodes = False
             
-            for node in current_level:
-                if node is None:
-                    level_str += "    "
-                    next_level.extend([None, None])
-                else:
-                    level_str += f"{node.root}(h{node.height}) "
-                    next_level.append(node.left)
-                    next_level.append(node.right)
+            for item in current_level:
+                if isinstance(item, int):
+                    parts.append("    " * item)
+                    empty_run += 2 * item
+                    continue
+                
+                parts.append(f"{item.root}(h{item.height}) ")
+                for child in (item.left, item.right):
+                    if child is None:
+                        empty_run += 1
+                    else:
+                        if empty_run:
+                            next_level.append(empty_run)
+                            empty_run = 0
+                        next_level.append(child)
+                        has_nodes = True
+            
+            if empty_run:
+                next_level.append(empty_run)
             
-            result.append(level_str.center(100))
+            result.append("".join(parts).center(100))
             current_level = next_level
         
         return "\n".join(result)
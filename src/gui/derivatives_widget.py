@@ -10,6 +10,7 @@ from PyQt6.QtWidgets import (
     QMessageBox, QScrollArea, QGroupBox
 )
 from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QColor
 
 
 class DerivativesWidget(QWidget):
@@ -97,6 +98,8 @@ class DerivativesWidget(QWidget):
         self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         self.table.setAlternatingRowColors(True)
         self.table.setMinimumHeight(250)
+        # Delete cells are plain items; one handler serves every row
+        self.table.cellClicked.connect(self._on_cell_clicked)
         main_layout.addWidget(self.table)
 
         # Clear all button
@@ -124,27 +127,15 @@ class DerivativesWidget(QWidget):
         self.root_combo.clear()
         self.root_combo.addItem("-- اختر جذراً --")
 
-        # Get all roots from the tree (inorder traversal)
-        all_roots = self.engine.roots_tree.display_inorder()
-
-        # Separate roots with and without derivatives
+        # Separate roots with and without derivatives in one in-order pass
         roots_with = []
         roots_without = []
-        for root in all_roots:
-            node = self.engine.roots_tree.search(root)
-            if node and node.get_derivative_count() > 0:
-                roots_with.append(root)
-            else:
-                roots_without.append(root)
-
-        # Add roots with derivatives first (with ✅ marker)
-        for root in roots_with:
-            self.root_combo.addItem(f"✅ {root}")
-
-        # Add roots without derivatives
-        for root in roots_without:
-            self.root_combo.addItem(root)
+        for node in self.engine.roots_tree.get_all_nodes():
+            (roots_with if node.derivatives else roots_without).append(node.root)
 
+        # Roots with derivatives first (with ✅ marker), then the rest
+        self.root_combo.addItems([f"✅ {root}" for root in roots_with])
+        self.root_combo.addItems(roots_without)
 
         # If no roots at all, show placeholder
         if self.root_combo.count() == 1:
@@ -175,46 +166,60 @@ class DerivativesWidget(QWidget):
             return
 
         derivatives = node.get_derivatives()
-        if not derivatives:
-            # Show a message in the table
-            self.table.setRowCount(1)
-            self.table.setSpan(0, 0, 1, 4)
-            msg_item = QTableWidgetItem("🚫 لا توجد مشتقات لهذا الجذر بعد")
-            msg_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            msg_item.setFlags(Qt.ItemFlag.ItemIsEnabled)  # not selectable
-            self.table.setItem(0, 0, msg_item)
-            return
 
-        self.table.setRowCount(len(derivatives))
-        for i, deriv in enumerate(derivatives):
-            # Word
-            self.table.setItem(i, 0, QTableWidgetItem(deriv['word']))
-            # Pattern
-            self.table.setItem(i, 1, QTableWidgetItem(deriv['pattern']))
-            # Frequency
-            self.table.setItem(i, 2, QTableWidgetItem(str(deriv['frequency'])))
-            # Delete button
-            btn = QPushButton("✖️ حذف")
-            btn.setMinimumHeight(35)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #F44336;
-                    color: white;
-                    border-radius: 5px;
-                    padding: 5px;
-                }
-                QPushButton:hover {
-                    background-color: #D32F2F;
-                }
-            """)
-            btn.clicked.connect(
-                lambda checked, w=deriv['word'], p=deriv['pattern']:
-                self._remove_derivative(w, p)
-            )
-            self.table.setCellWidget(i, 3, btn)
-
-    def _remove_derivative(self, word, pattern):
-        """Remove a single derivative after confirmation."""
+        # Fill the table in one batch: no repaints or signals per row
+        table = self.table
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.clearSpans()
+            table.setRowCount(0)
+
+            if not derivatives:
+                # Show a message in the table
+                table.setRowCount(1)
+                table.setSpan(0, 0, 1, 4)
+                msg_item = QTableWidgetItem("🚫 لا توجد مشتقات لهذا الجذر بعد")
+                msg_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                msg_item.setFlags(Qt.ItemFlag.ItemIsEnabled)  # not selectable
+                table.setItem(0, 0, msg_item)
+                return
+
+            delete_bg = QColor('#F44336')
+            delete_fg = QColor('white')
+            table.setRowCount(len(derivatives))
+            for i, deriv in enumerate(derivatives):
+                # Word
+                table.setItem(i, 0, QTableWidgetItem(deriv['word']))
+                # Pattern
+                table.setItem(i, 1, QTableWidgetItem(deriv['pattern']))
+                # Frequency
+                table.setItem(i, 2, QTableWidgetItem(str(deriv['frequency'])))
+                # Delete cell (handled by _on_cell_clicked)
+                delete_item = QTableWidgetItem("✖️ حذف")
+                delete_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                delete_item.setBackground(delete_bg)
+                delete_item.setForeground(delete_fg)
+                delete_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
+                delete_item.setData(Qt.ItemDataRole.UserRole, (deriv['word'], deriv['pattern']))
+                delete_item.setToolTip("حذف هذا المشتق")
+                table.setItem(i, 3, delete_item)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+
+    def _on_cell_clicked(self, row, column):
+        """Remove the derivative of the row whose delete cell was clicked."""
+        if column != 3:
+            return
+        item = self.table.item(row, column)
+        entry = item.data(Qt.ItemDataRole.UserRole) if item else None
+        if entry:
+            word, pattern = entry
+            self._remove_derivative(word, pattern, row)
+
+    def _remove_derivative(self, word, pattern, row=None):
+        """Remove a single derivative after confirmation (row: its table row, if known)."""
         if not self.current_root:
             return
         reply = QMessageBox.question(
@@ -226,11 +231,25 @@ class DerivativesWidget(QWidget):
             if self.engine.remove_derivative(self.current_root, word, pattern):
                 QMessageBox.information(self, "نجاح", "تم حذف المشتق")
                 self.derivative_removed.emit(self.current_root, word)
-                self._load_derivatives(self.current_root)
-                self.refresh_root_list()  # update checkmarks
+                node = self.engine.roots_tree.search(self.current_root)
+                if row is not None and node and node.get_derivative_count() > 0:
+                    # Other derivatives remain: drop just this row
+                    self.table.removeRow(row)
+                else:
+                    # Last one gone: show the empty message and drop the ✅ marker
+                    self._load_derivatives(self.current_root)
+                    self._unmark_root(self.current_root)
             else:
                 QMessageBox.critical(self, "خطأ", "فشل حذف المشتق")
 
+    def _unmark_root(self, root):
+        """Remove the ✅ marker of a root in the combo box, in place."""
+        index = self.root_combo.findText(f"✅ {root}")
+        if index >= 0:
+            self.root_combo.blockSignals(True)
+            self.root_combo.setItemText(index, root)
+            self.root_combo.blockSignals(False)
+
     def _clear_all_derivatives(self):
         """Clear all derivatives for the current root."""
         if not self.current_root:
@@ -2,34 +2,111 @@
 Enhanced Main Window – Complete Integration
 Includes all tabs, menus, and dialogs.
 """
-import json
 import os
+from functools import partial
+from importlib import import_module
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QTabWidget, QPushButton,
-    QMessageBox, QFileDialog, QStatusBar, QApplication, QSizePolicy
+    QMessageBox, QFileDialog, QStatusBar, QApplication, QSizePolicy, QProgressBar
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QAction, QShortcut, QKeySequence
-
-# Import custom widgets
-from .enhanced_widgets import EnhancedGenerationWidget, EnhancedValidationWidget
-from .enhanced_roots_patterns import EnhancedRootsWidget, EnhancedPatternsWidget, EnhancedDashboardWidget
-from .derivatives_widget import DerivativesWidget
-from .charts_widget import StatisticsChartsWidget
-from .tree_dialog import TreeOperationsDialog
-from .hash_dialog import HashTableInfoDialog
-from .pattern_validation_dialog import PatternValidationDialog
+from PyQt6.QtCore import Qt, QTimer, QObject, QThread, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QAction
+
+# Tab widgets and dialogs are imported where they are first used, so
+# modules such as charts_widget (pyqtgraph) only load when needed
 from .gui_styles import AppStyles
-from .splash_screen import SplashScreen
+from pattern_manager import read_json_file
+
+# Default data files (project_root/data), resolved once at import
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data")
+DEFAULT_ROOTS_PATH = os.path.join(DATA_DIR, "roots.txt")
+DEFAULT_PATTERNS_PATH = os.path.join(DATA_DIR, "patterns.json")
+
+# Static "about" HTML, built once at import
+ABOUT_HTML = """
+    <div style='direction: rtl; text-align: center;'>
+        <h2 style='color: #6B5B95;'>🌙 محرك البحث المورفولوجي</h2>
+        <p><b>الإصدار:</b> 2.0</p>
+        <p><b>المطورون:</b> Zouaoui Mouadh, Ayari Yosr, Khadhraoui Malak</p>
+        <p><b>جامعة:</b> [اسم الجامعة]</p>
+        <hr>
+        <p style='font-size: 11pt;'>هيكل بيانات متقدم للتعامل مع الجذور العربية<br>
+        شجرة AVL للجذور – جدول تجزئة للأوزان</p>
+    </div>
+    """
+
+# Parsed data files: path -> ((mtime_ns, size), data)
+_PARSED_FILES = {}
+
+
+def _parse_cached(path, parser):
+    """
+    Parse a data file, reusing the last result while the file is unchanged.
+
+    Args:
+        path (str): File to read
+        parser (callable): Reads the file at a path into Python data
+
+    Returns:
+        The parsed data; it is shared between loads, so callers must not modify it
+    """
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _PARSED_FILES.get(path)
+    if cached is None or cached[0] != key:
+        cached = (key, parser(path))
+        _PARSED_FILES[path] = cached
+    return cached[1]
+
+
+def _parse_roots(path):
+    """Non-empty, stripped lines of a roots file (one bulk read, stripped in C)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return list(filter(None, map(str.strip, f.read().split('\n'))))
+
+
+class _DataFileLoader(QObject):
+    """Reads and parses the data files on a worker thread."""
+    loaded = pyqtSignal(object, object)  # roots list, patterns dict (passed as-is)
+    failed = pyqtSignal(str)
+
+    def __init__(self, roots_path, patterns_path):
+        super().__init__()
+        self.roots_path = roots_path
+        self.patterns_path = patterns_path
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            # Files are only re-parsed after they change
+            roots = _parse_cached(self.roots_path, _parse_roots)
+            patterns = _parse_cached(self.patterns_path, read_json_file)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.loaded.emit(roots, patterns)
 
 
 class EnhancedMainWindow(QMainWindow):
     """Main application window with all integrated features."""
 
+    # Tabs in display order: (widget attribute, title, module, class)
+    TABS = [
+        ('dashboard_widget', "لوحة التحكم", '.enhanced_roots_patterns', 'EnhancedDashboardWidget'),
+        ('roots_widget', "الجذور", '.enhanced_roots_patterns', 'EnhancedRootsWidget'),
+        ('patterns_widget', "الأوزان", '.enhanced_roots_patterns', 'EnhancedPatternsWidget'),
+        ('generation_widget', "توليد الكلمات", '.enhanced_widgets', 'EnhancedGenerationWidget'),
+        ('validation_widget', "التحقق", '.enhanced_widgets', 'EnhancedValidationWidget'),
+        ('derivatives_widget', "المشتقات", '.derivatives_widget', 'DerivativesWidget'),
+        ('charts_widget', "إحصائيات مرئية", '.charts_widget', 'StatisticsChartsWidget'),
+    ]
+
     def __init__(self, engine):
         super().__init__()
         self.engine = engine
         self.data_loaded = False
+        self._file_dialogs = {}  # name filter -> reusable QFileDialog
+        self._loader_thread = None  # Running data load, if any
         self._setup_ui()
         self._create_menu_bar()
         self._create_status_bar()
@@ -57,27 +134,45 @@ class EnhancedMainWindow(QMainWindow):
         self.tabs.setLayoutDirection(Qt.LayoutDirection.RightToLeft)
         self.tabs.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
-        # Create all tabs
-        self.dashboard_widget = EnhancedDashboardWidget(self.engine)
-        self.generation_widget = EnhancedGenerationWidget(self.engine)
-        self.validation_widget = EnhancedValidationWidget(self.engine)
-        self.roots_widget = EnhancedRootsWidget(self.engine)
-        self.patterns_widget = EnhancedPatternsWidget(self.engine)
-        self.derivatives_widget = DerivativesWidget(self.engine)
-        self.charts_widget = StatisticsChartsWidget(self.engine)
-
-        # Add tabs in logical order
-        self.tabs.addTab(self.dashboard_widget, "لوحة التحكم")
-        self.tabs.addTab(self.roots_widget, "الجذور")
-        self.tabs.addTab(self.patterns_widget, "الأوزان")
-        self.tabs.addTab(self.generation_widget, "توليد الكلمات")
-        self.tabs.addTab(self.validation_widget, "التحقق")
-        self.tabs.addTab(self.derivatives_widget, "المشتقات")
-        self.tabs.addTab(self.charts_widget, "إحصائيات مرئية")
+        # Tabs start as empty placeholders; each real widget is built on
+        # first visit (see _ensure_tab_loaded), only the dashboard up front
+        for name, title, _, _ in self.TABS:
+            setattr(self, name, None)
+            self.tabs.addTab(QWidget(), title)
+        self._ensure_tab_loaded(0)
 
         # Add tab widget to main layout with stretch factor 1 (takes all remaining space)
         main_layout.addWidget(self.tabs, 1)
 
+    def _ensure_tab_loaded(self, index):
+        """Build the real widget of a tab the first time it is needed."""
+        name, title, module_name, class_name = self.TABS[index]
+        widget = getattr(self, name)
+        if widget is None:
+            # Imported on first visit; sys.modules caches it afterwards
+            widget_class = getattr(import_module(module_name, __package__), class_name)
+            widget = widget_class(self.engine)
+            setattr(self, name, widget)
+            self._connect_widget_signals(widget)
+
+            # Swap the placeholder out without re-entering _on_tab_changed
+            current = self.tabs.currentIndex()
+            placeholder = self.tabs.widget(index)
+            self.tabs.blockSignals(True)
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, widget, title)
+            self.tabs.setCurrentIndex(current)
+            self.tabs.blockSignals(False)
+            placeholder.deleteLater()
+        return widget
+
+    def _show_tab(self, name):
+        """Switch to the tab holding the given widget attribute."""
+        for index, (tab_name, _, _, _) in enumerate(self.TABS):
+            if tab_name == name:
+                self.tabs.setCurrentIndex(index)
+                return
+
     def _create_menu_bar(self):
         """Create menu bar with all actions."""
         menubar = self.menuBar()
@@ -131,7 +226,7 @@ class EnhancedMainWindow(QMainWindow):
         view_menu = menubar.addMenu("عرض")
 
         self.stats_action = QAction("📊 لوحة التحكم", self)
-        self.stats_action.triggered.connect(lambda: self.tabs.setCurrentWidget(self.dashboard_widget))
+        self.stats_action.triggered.connect(lambda: self._show_tab('dashboard_widget'))
         view_menu.addAction(self.stats_action)
 
         # ----- Help Menu -----
@@ -150,52 +245,60 @@ class EnhancedMainWindow(QMainWindow):
     def _connect_signals(self):
         """Connect signals between widgets."""
         try:
-            # Tab change
+            # Tab change (widget signals are connected as each tab is built)
             self.tabs.currentChanged.connect(self._on_tab_changed)
 
-            # Data change signals
-            self.roots_widget.root_added.connect(self._on_data_changed)
-            self.patterns_widget.pattern_added.connect(self._on_data_changed)
-            self.patterns_widget.pattern_modified.connect(self._on_data_changed)
+        except Exception as e:
+            print(f"Signal connection error: {e}")
 
+    def _connect_widget_signals(self, widget):
+        """Connect the signals a freshly built tab widget offers."""
+        handlers = {
+            # Data change signals
+            'root_added': self._on_data_changed,
+            'pattern_added': self._on_data_changed,
+            'pattern_modified': self._on_data_changed,
             # Generation
-            self.generation_widget.generation_completed.connect(self._on_generation_completed)
-
+            'generation_completed': self._on_generation_completed,
             # Derivatives
-            self.derivatives_widget.derivative_removed.connect(self._on_derivative_removed)
-            self.derivatives_widget.derivatives_cleared.connect(self._on_derivatives_cleared)
-
+            'derivative_removed': self._on_derivative_removed,
+            'derivatives_cleared': self._on_derivatives_cleared,
+        }
+        try:
+            for signal_name, handler in handlers.items():
+                signal = getattr(widget, signal_name, None)
+                if signal is not None:
+                    signal.connect(handler)
         except Exception as e:
             print(f"Signal connection error: {e}")
 
     def _setup_shortcuts(self):
         """Setup global keyboard shortcuts."""
-        # Switch tabs
-        QShortcut(QKeySequence("Ctrl+1"), self, lambda: self.tabs.setCurrentIndex(0))
-        QShortcut(QKeySequence("Ctrl+2"), self, lambda: self.tabs.setCurrentIndex(1))
-        QShortcut(QKeySequence("Ctrl+3"), self, lambda: self.tabs.setCurrentIndex(2))
-        QShortcut(QKeySequence("Ctrl+4"), self, lambda: self.tabs.setCurrentIndex(3))
-        QShortcut(QKeySequence("Ctrl+5"), self, lambda: self.tabs.setCurrentIndex(4))
-        QShortcut(QKeySequence("Ctrl+6"), self, lambda: self.tabs.setCurrentIndex(5))
-        QShortcut(QKeySequence("Ctrl+7"), self, lambda: self.tabs.setCurrentIndex(6))
-
-        # Quick actions
-        QShortcut(QKeySequence("Ctrl+N"), self, lambda: self.tabs.setCurrentWidget(self.roots_widget))
-        QShortcut(QKeySequence("Ctrl+G"), self, lambda: self.tabs.setCurrentWidget(self.generation_widget))
-        QShortcut(QKeySequence("Ctrl+V"), self, lambda: self.tabs.setCurrentWidget(self.validation_widget))
+        # Window-level actions, one per tab (Ctrl+1..Ctrl+7), then quick actions
+        shortcuts = [(f"Ctrl+{i + 1}", partial(self.tabs.setCurrentIndex, i))
+                     for i in range(len(self.TABS))]
+        shortcuts += [
+            ("Ctrl+N", partial(self._show_tab, 'roots_widget')),
+            ("Ctrl+G", partial(self._show_tab, 'generation_widget')),
+            ("Ctrl+V", partial(self._show_tab, 'validation_widget')),
+        ]
+
+        # Keep references so the actions are not garbage collected
+        self._shortcut_actions = []
+        for key, handler in shortcuts:
+            action = QAction(self)
+            action.setShortcut(key)
+            action.triggered.connect(handler)
+            self.addAction(action)
+            self._shortcut_actions.append(action)
 
     # ---------- Data Loading ----------
     def _try_auto_load_data(self):
         """Try to auto-load data from default paths."""
         try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            project_root = os.path.abspath(os.path.join(script_dir, "..", ".."))
-            data_dir = os.path.join(project_root, "data")
-            roots_path = os.path.join(data_dir, "roots.txt")
-            patterns_path = os.path.join(data_dir, "patterns.json")
-
-            if os.path.exists(roots_path) and os.path.exists(patterns_path):
-                self._load_data_from_files(roots_path, patterns_path, silent=True)
+            # Only the existence checks hit the filesystem: files may appear later
+            if os.path.isfile(DEFAULT_ROOTS_PATH) and os.path.isfile(DEFAULT_PATTERNS_PATH):
+                self._load_data_from_files(DEFAULT_ROOTS_PATH, DEFAULT_PATTERNS_PATH, silent=True)
             else:
                 self.status_bar.showMessage("البيانات غير موجودة – يرجى تحميلها يدوياً", 5000)
         except Exception as e:
@@ -221,7 +324,7 @@ class EnhancedMainWindow(QMainWindow):
             roots_browse = QPushButton("استعراض")
 
             def browse_roots():
-                file, _ = QFileDialog.getOpenFileName(dialog, "اختر ملف الجذور", "", "Text Files (*.txt)")
+                file = self._choose_file("اختر ملف الجذور", "Text Files (*.txt)")
                 if file:
                     roots_input.setText(file)
 
@@ -239,7 +342,7 @@ class EnhancedMainWindow(QMainWindow):
             patterns_browse = QPushButton("استعراض")
 
             def browse_patterns():
-                file, _ = QFileDialog.getOpenFileName(dialog, "اختر ملف الأوزان", "", "JSON Files (*.json)")
+                file = self._choose_file("اختر ملف الأوزان", "JSON Files (*.json)")
                 if file:
                     patterns_input.setText(file)
 
@@ -270,18 +373,55 @@ class EnhancedMainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "خطأ", f"حدث خطأ: {str(e)}")
 
+    def _choose_file(self, title, name_filter):
+        """Pick an existing file, reusing one dialog per filter so it remembers its folder."""
+        file_dialog = self._file_dialogs.get(name_filter)
+        if file_dialog is None:
+            file_dialog = QFileDialog(self, title, "", name_filter)
+            file_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+            self._file_dialogs[name_filter] = file_dialog
+        if file_dialog.exec() == QFileDialog.DialogCode.Accepted:
+            return file_dialog.selectedFiles()[0]
+        return ""
+
     def _load_data_from_files(self, roots_path, patterns_path, silent=False):
-        """Internal method to load data and refresh UI."""
-        try:
-            # Load roots
-            with open(roots_path, 'r', encoding='utf-8') as f:
-                roots = [line.strip() for line in f if line.strip()]
-                self.engine.load_roots(roots)
+        """
+        Load data and refresh UI.
 
-            # Load patterns
-            with open(patterns_path, 'r', encoding='utf-8') as f:
-                patterns = json.load(f)
-                self.engine.load_patterns(patterns)
+        The files are read and parsed on a worker thread; the engine is only
+        filled on the GUI thread (_on_data_files_loaded), which widgets share.
+        """
+        if self._loader_thread is not None:
+            self.status_bar.showMessage("جارٍ تحميل البيانات...", 3000)
+            return
+
+        self._load_silent = silent
+        self._loader = _DataFileLoader(roots_path, patterns_path)
+        self._loader_thread = QThread(self)
+        self._loader.moveToThread(self._loader_thread)
+        self._loader_thread.started.connect(self._loader.run)
+        self._loader.loaded.connect(self._on_data_files_loaded)
+        self._loader.failed.connect(self._on_data_files_failed)
+        self._loader.loaded.connect(self._loader_thread.quit)
+        self._loader.failed.connect(self._loader_thread.quit)
+        self._loader_thread.finished.connect(self._on_loader_finished)
+
+        # Busy indicator while the worker runs
+        self._load_progress = QProgressBar()
+        self._load_progress.setRange(0, 0)
+        self._load_progress.setMaximumWidth(150)
+        self.status_bar.addPermanentWidget(self._load_progress)
+
+        self._loader_thread.start()
+
+    @pyqtSlot(object, object)
+    def _on_data_files_loaded(self, roots, patterns):
+        """Fill the engine with the parsed files (GUI thread)."""
+        silent = self._load_silent
+        try:
+            self.engine.load_roots(roots)
+            # The hash table edits pattern dicts in place, so it gets copies
+            self.engine.load_patterns({name: dict(data) for name, data in patterns.items()})
 
             self.data_loaded = True
             self._refresh_all_widgets()
@@ -299,8 +439,22 @@ class EnhancedMainWindow(QMainWindow):
             )
 
         except Exception as e:
-            if not silent:
-                QMessageBox.critical(self, "خطأ", f"فشل تحميل البيانات: {e}")
+            self._on_data_files_failed(str(e))
+
+    @pyqtSlot(str)
+    def _on_data_files_failed(self, error):
+        """Report a failed data load."""
+        if not self._load_silent:
+            QMessageBox.critical(self, "خطأ", f"فشل تحميل البيانات: {error}")
+
+    @pyqtSlot()
+    def _on_loader_finished(self):
+        """Release the worker thread and remove the busy indicator."""
+        self.status_bar.removeWidget(self._load_progress)
+        self._load_progress.deleteLater()
+        self._loader.deleteLater()
+        self._loader_thread.deleteLater()
+        self._loader = self._loader_thread = None
 
     def reload_data(self):
         """Reload data from last used paths or auto-load."""
@@ -339,62 +493,68 @@ class EnhancedMainWindow(QMainWindow):
 
     # ---------- Dialogs ----------
     def show_tree_dialog(self):
+        from .tree_dialog import TreeOperationsDialog
         dialog = TreeOperationsDialog(self.engine, self)
         dialog.exec()
 
     def show_hash_dialog(self):
+        from .hash_dialog import HashTableInfoDialog
         dialog = HashTableInfoDialog(self.engine, self)
         dialog.exec()
 
     def show_pattern_validation_dialog(self):
+        from .pattern_validation_dialog import PatternValidationDialog
         dialog = PatternValidationDialog(self.engine, self)
         dialog.exec()
 
     def show_about(self):
-        about_text = """
-        <div style='direction: rtl; text-align: center;'>
-            <h2 style='color: #6B5B95;'>🌙 محرك البحث المورفولوجي</h2>
-            <p><b>الإصدار:</b> 2.0</p>
-            <p><b>المطورون:</b> Zouaoui Mouadh, Ayari Yosr, Khadhraoui Malak</p>
-            <p><b>جامعة:</b> [اسم الجامعة]</p>
-            <hr>
-            <p style='font-size: 11pt;'>هيكل بيانات متقدم للتعامل مع الجذور العربية<br>
-            شجرة AVL للجذور – جدول تجزئة للأوزان</p>
-        </div>
-        """
-        QMessageBox.about(self, "حول", about_text)
+        QMessageBox.about(self, "حول", ABOUT_HTML)
 
     # ---------- Signal Handlers ----------
+    @pyqtSlot(int)
     def _on_tab_changed(self, index):
-        """Refresh widget when its tab becomes visible."""
-        widget = self.tabs.widget(index)
+        """Build (on first visit) and refresh widget when its tab becomes visible."""
+        widget = self._ensure_tab_loaded(index)
         if hasattr(widget, 'refresh'):
             widget.refresh()
 
+    @pyqtSlot()
     def _on_data_changed(self):
         """Refresh all widgets that display data."""
         self._refresh_all_widgets()
 
+    @pyqtSlot(object)
     def _on_generation_completed(self, result):
         """Show generation feedback in status bar."""
         word = result.get('generated_word', result.get('word', ''))
         self.status_bar.showMessage(f"✅ تم توليد: {word}", 3000)
 
+    @pyqtSlot(str, str)
     def _on_derivative_removed(self, root, word):
         self.status_bar.showMessage(f"🗑️ تم حذف '{word}' من الجذر '{root}'", 3000)
 
+    @pyqtSlot(str)
     def _on_derivatives_cleared(self, root):
         self.status_bar.showMessage(f"🧹 تم حذف جميع مشتقات '{root}'", 3000)
 
     def _refresh_all_widgets(self):
-        """Refresh all tabs that have a refresh method."""
-        for i in range(self.tabs.count()):
-            widget = self.tabs.widget(i)
-            if hasattr(widget, 'refresh'):
-                try:
-                    widget.refresh()
-                except Exception as e:
-                    print(f"Refresh error in {widget.__class__.__name__}: {e}")
+        """
+        Bring the tabs up to date with the engine data.
+
+        Only the visible tab is refreshed here: every other tab is refreshed
+        by _on_tab_changed when it is next shown, so hidden tables and
+        charts are not rebuilt for nothing.
+        """
+        widget = self.tabs.currentWidget()
+        if hasattr(widget, 'refresh'):
+            # Repaint the tab once, after all its children are updated
+            widget.setUpdatesEnabled(False)
+            try:
+                widget.refresh()
+            except Exception as e:
+                print(f"Refresh error in {widget.__class__.__name__}: {e}")
+            finally:
+                widget.setUpdatesEnabled(True)
 
     # ---------- Close Event ----------
     def closeEvent(self, event):
@@ -406,6 +566,10 @@ class EnhancedMainWindow(QMainWindow):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.Yes:
+            if self._loader_thread is not None:
+                # Let a running data load finish before its thread is destroyed
+                self._loader_thread.quit()
+                self._loader_thread.wait()
             event.accept()
         else:
             event.ignore()
@@ -421,7 +585,8 @@ def run_gui_app(engine):
     AppStyles.apply_app_style(app)
     app.setLayoutDirection(Qt.LayoutDirection.RightToLeft)
 
-    # Show splash screen
+    # Show splash screen (imported once the QApplication exists)
+    from .splash_screen import SplashScreen
     splash = SplashScreen()
     splash.show()
     splash.updateProgress(10)
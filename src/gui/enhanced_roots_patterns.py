@@ -19,6 +19,22 @@ from .root_analysis_dialog import RootAnalysisDialog
 from .enhanced_widgets import CardWidget
 
 
+# Static dashboard HTML, built once at import
+DASHBOARD_INFO_HTML = """
+    <div style='direction: rtl; font-size: 13pt;'>
+        <h3 style='color: #6B5B95;'>المميزات:</h3>
+        <ul>
+            <li>🌳 <b>شجرة AVL للجذور:</b> O(log n)</li>
+            <li>⚡ <b>جدول التجزئة للأوزان:</b> O(1)</li>
+            <li>🔄 <b>توليد الكلمات</b> مع مراعاة أنواع الجذور</li>
+            <li>✅ <b>التحقق المورفولوجي</b> مع دعم المشتقات المتعددة</li>
+            <li>📚 <b>إدارة المشتقات</b> (عرض، حذف)</li>
+            <li>📊 <b>إحصائيات مرئية</b> ورسوم بيانية</li>
+        </ul>
+    </div>
+    """
+
+
 # ============================================================================
 # DASHBOARD WIDGET (unchanged)
 # ============================================================================
@@ -80,24 +96,20 @@ class EnhancedDashboardWidget(QWidget):
         stats_layout.addWidget(self.derivatives_card, 1, 0)
         stats_layout.addWidget(self.tree_card, 1, 1)
 
+        # Statistic key -> value label, updated in place by refresh()
+        self._value_labels = {
+            'roots_count': self.roots_card.value_label,
+            'patterns_count': self.patterns_card.value_label,
+            'generated_words_count': self.derivatives_card.value_label,
+            'avl_tree_height': self.tree_card.value_label,
+        }
+
         main_layout.addLayout(stats_layout)
 
         # Info card
         info_card = CardWidget("معلومات النظام")
-        info_text = """
-        <div style='direction: rtl; font-size: 13pt;'>
-            <h3 style='color: #6B5B95;'>المميزات:</h3>
-            <ul>
-                <li>🌳 <b>شجرة AVL للجذور:</b> O(log n)</li>
-                <li>⚡ <b>جدول التجزئة للأوزان:</b> O(1)</li>
-                <li>🔄 <b>توليد الكلمات</b> مع مراعاة أنواع الجذور</li>
-                <li>✅ <b>التحقق المورفولوجي</b> مع دعم المشتقات المتعددة</li>
-                <li>📚 <b>إدارة المشتقات</b> (عرض، حذف)</li>
-                <li>📊 <b>إحصائيات مرئية</b> ورسوم بيانية</li>
-            </ul>
-        </div>
-        """
-        info_label = QLabel(info_text)
+        info_label = QLabel(DASHBOARD_INFO_HTML)
+        info_label.setTextFormat(Qt.TextFormat.RichText)
         info_label.setWordWrap(True)
         info_label.setMinimumHeight(150)
         info_card.add_widget(info_label)
@@ -118,19 +130,20 @@ class EnhancedDashboardWidget(QWidget):
 
         icon_label = QLabel(icon)
         icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        icon_label.setStyleSheet("font-size: 36pt;")
+        icon_label.setObjectName("statIcon")  # Styled by the app stylesheet
 
         value_label = QLabel(value)
         value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        value_label.setStyleSheet("font-size: 18pt; font-weight: bold; color: #2C2416;")
+        value_label.setObjectName("statValue")
 
         text_label = QLabel(label)
         text_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        text_label.setStyleSheet("font-size: 14pt; font-weight: bold; color: #5A4E3A;")
+        text_label.setObjectName("statText")
 
         card.card_layout.addWidget(icon_label)
         card.card_layout.addWidget(value_label)
         card.card_layout.addWidget(text_label)
+        card.value_label = value_label
 
         return card
 
@@ -138,10 +151,13 @@ class EnhancedDashboardWidget(QWidget):
         """Refresh dashboard statistics."""
         try:
             stats = self.engine.get_engine_statistics()
-            self.roots_card.card_layout.itemAt(1).widget().setText(str(stats['roots_count']))
-            self.patterns_card.card_layout.itemAt(1).widget().setText(str(stats['patterns_count']))
-            self.derivatives_card.card_layout.itemAt(1).widget().setText(str(stats['generated_words_count']))
-            self.tree_card.card_layout.itemAt(1).widget().setText(str(stats['avl_tree_height']))
+            # One repaint for the four cards
+            self.setUpdatesEnabled(False)
+            try:
+                for key, label in self._value_labels.items():
+                    label.setText(str(stats[key]))
+            finally:
+                self.setUpdatesEnabled(True)
         except Exception as e:
             print(f"Error refreshing dashboard: {e}")
 
@@ -153,6 +169,7 @@ class EnhancedRootsWidget(QWidget):
     """Roots management with correct expanding layout."""
     root_added = pyqtSignal(str)
     root_selected = pyqtSignal(str)
+    DERIVATIVES_PAGE = 10  # Derivatives shown per page in the root info dialog
 
     def __init__(self, engine, parent=None):
         super().__init__(parent)
@@ -324,22 +341,8 @@ class EnhancedRootsWidget(QWidget):
         node = self.engine.roots_tree.search(normalized)
 
         if node:
-            # Build rich text info
-            info = f"<h2 style='color: #6B5B95;'>✅ الجذر: {node.root}</h2>"
-            info += f"<p><b>📊 التكرار:</b> {node.frequency}</p>"
-            info += f"<p><b>📚 عدد المشتقات:</b> {node.get_derivative_count()}</p>"
-            info += f"<p><b>📏 الارتفاع في الشجرة:</b> {node.height}</p>"
-
             derivatives = node.get_derivatives()
-            if derivatives:
-                info += "<h3 style='color: #2C2416;'>📝 المشتقات:</h3><ul>"
-                for deriv in derivatives[:10]:  # Show first 10
-                    info += f"<li><b>{deriv['word']}</b> (الوزن: {deriv['pattern']}, التكرار: {deriv['frequency']})</li>"
-                if len(derivatives) > 10:
-                    info += f"<li>... و {len(derivatives)-10} مشتق آخر</li>"
-                info += "</ul>"
-            else:
-                info += "<p><i>لا توجد مشتقات لهذا الجذر بعد.</i></p>"
+            shown = min(len(derivatives), self.DERIVATIVES_PAGE)
 
             # Create custom dialog
             dialog = QDialog(self)
@@ -351,7 +354,7 @@ class EnhancedRootsWidget(QWidget):
 
             # Text edit for rich text
             text_edit = QTextEdit()
-            text_edit.setHtml(info)
+            text_edit.setHtml(self._root_info_html(node, derivatives, shown))
             text_edit.setReadOnly(True)
             text_edit.setStyleSheet("""
                 QTextEdit {
@@ -364,6 +367,20 @@ class EnhancedRootsWidget(QWidget):
             """)
             layout.addWidget(text_edit)
 
+            # Load more button: only ever render a page more than before
+            more_btn = QPushButton("📄 عرض المزيد")
+            more_btn.setMinimumHeight(40)
+            more_btn.setVisible(shown < len(derivatives))
+
+            def show_more():
+                nonlocal shown
+                shown = min(len(derivatives), shown + self.DERIVATIVES_PAGE)
+                text_edit.setHtml(self._root_info_html(node, derivatives, shown))
+                more_btn.setVisible(shown < len(derivatives))
+
+            more_btn.clicked.connect(show_more)
+            layout.addWidget(more_btn)
+
             # Close button
             close_btn = QPushButton("إغلاق")
             close_btn.setMinimumHeight(40)
@@ -374,6 +391,27 @@ class EnhancedRootsWidget(QWidget):
         else:
             QMessageBox.warning(self, "غير موجود", f"الجذر '{root}' غير موجود في الشجرة")
 
+    def _root_info_html(self, node, derivatives, shown):
+        """Rich text info for a root, listing only its first `shown` derivatives."""
+        parts = [
+            f"<h2 style='color: #6B5B95;'>✅ الجذر: {node.root}</h2>",
+            f"<p><b>📊 التكرار:</b> {node.frequency}</p>",
+            f"<p><b>📚 عدد المشتقات:</b> {len(derivatives)}</p>",
+            f"<p><b>📏 الارتفاع في الشجرة:</b> {node.height}</p>"
+        ]
+
+        if derivatives:
+            parts.append("<h3 style='color: #2C2416;'>📝 المشتقات:</h3><ul>")
+            for deriv in derivatives[:shown]:
+                word, pattern, frequency = deriv['word'], deriv['pattern'], deriv['frequency']
+                parts.append(f"<li><b>{word}</b> (الوزن: {pattern}, التكرار: {frequency})</li>")
+            if len(derivatives) > shown:
+                parts.append(f"<li>... و {len(derivatives)-shown} مشتق آخر</li>")
+            parts.append("</ul>")
+        else:
+            parts.append("<p><i>لا توجد مشتقات لهذا الجذر بعد.</i></p>")
+        return "".join(parts)
+
     # ---------- ANALYZE ROOT ----------
     def _analyze_root(self):
         root = self.search_input.text().strip() or self.root_input.text().strip()
@@ -381,7 +419,7 @@ class EnhancedRootsWidget(QWidget):
             QMessageBox.warning(self, "تنبيه", "أدخل جذراً للتحليل")
             return
         normalized = self._normalize_root(root)
-        analysis = RootClassifier.classify(normalized)
+        analysis = RootClassifier.classify_cached(normalized)
         dialog = RootAnalysisDialog(analysis, self)
         dialog.exec()
 
@@ -556,7 +594,10 @@ class EnhancedPatternsWidget(QWidget):
             success, message = self.engine.add_pattern(name, template, desc, example)
             if success:
                 QMessageBox.information(self, "نجاح", f"✅ {message}")
-                self.refresh()
+                # New names only: append one row instead of reloading the table
+                row = self.patterns_table.rowCount()
+                self.patterns_table.insertRow(row)
+                self._set_pattern_row(row, name, self.engine.patterns_table.search(name))
                 self.pattern_added.emit(name)
             else:
                 QMessageBox.warning(self, "خطأ", f"❌ {message}")
@@ -628,7 +669,7 @@ class EnhancedPatternsWidget(QWidget):
             success, message = self.engine.edit_pattern(name, **updates)
             if success:
                 QMessageBox.information(self, "نجاح", f"✅ {message}")
-                self.refresh()
+                self._set_pattern_row(row, name, self.engine.patterns_table.search(name))
                 self.pattern_modified.emit(name)
             else:
                 QMessageBox.warning(self, "خطأ", f"❌ {message}")
@@ -650,7 +691,7 @@ class EnhancedPatternsWidget(QWidget):
             success, message = self.engine.delete_pattern(name)
             if success:
                 QMessageBox.information(self, "نجاح", f"✅ {message}")
-                self.refresh()
+                self.patterns_table.removeRow(current_row)
             else:
                 QMessageBox.warning(self, "خطأ", f"❌ {message}")
 
@@ -680,12 +721,27 @@ class EnhancedPatternsWidget(QWidget):
 
     # ---------- REFRESH ----------
     def refresh(self):
-        self.patterns_table.setRowCount(0)
         patterns = self.engine.list_patterns(detailed=True)
-        for name, data in patterns.items():
-            row = self.patterns_table.rowCount()
-            self.patterns_table.insertRow(row)
-            self.patterns_table.setItem(row, 0, QTableWidgetItem(name))
-            self.patterns_table.setItem(row, 1, QTableWidgetItem(data.get('template', '')))
-            self.patterns_table.setItem(row, 2, QTableWidgetItem(data.get('description', '')))
-            self.patterns_table.setItem(row, 3, QTableWidgetItem(data.get('example', '')))
\ No newline at end of file
+        table = self.patterns_table
+        # Fill the table in one batch: no repaint or re-sort per cell
+        sorting = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        try:
+            table.setRowCount(len(patterns))
+            for row, (name, data) in enumerate(patterns.items()):
+                self._set_pattern_row(row, name, data)
+        finally:
+            table.setSortingEnabled(sorting)
+            table.setUpdatesEnabled(True)
+
+    def _set_pattern_row(self, row, name, data):
+        """Show one pattern in a table row, reusing the row's items when it has them."""
+        table = self.patterns_table
+        get = data.get
+        for column, text in enumerate((name, get('template', ''), get('description', ''), get('example', ''))):
+            item = table.item(row, column)
+            if item is None:
+                table.setItem(row, column, QTableWidgetItem(text))
+            elif item.text() != text:
+                item.setText(text)
\ No newline at end of file
@@ -46,7 +46,7 @@ class CardWidget(QWidget):
 # ============================================================================
 class EnhancedGenerationWidget(QWidget):
     """Word generation widget with root selection from dropdown."""
-    generation_completed = pyqtSignal(dict)
+    generation_completed = pyqtSignal(object)  # result dict, passed without QVariantMap conversion
 
     def __init__(self, engine, parent=None):
         super().__init__(parent)
@@ -193,11 +193,13 @@ class EnhancedGenerationWidget(QWidget):
             self.root_combo.addItem(root)
             self.all_root_combo.addItem(root)
 
-        self.pattern_combo.clear()
-        self.pattern_combo.addItem("اختر وزناً")
-        patterns = self.engine.patterns_table.get_all_patterns()
-        for pattern_name, _ in patterns:
-            self.pattern_combo.addItem(pattern_name)
+        # Patterns only need repopulating when the table has changed
+        patterns_table = self.engine.patterns_table
+        if getattr(self, '_patterns_version', None) != patterns_table.version:
+            self.pattern_combo.clear()
+            self.pattern_combo.addItem("اختر وزناً")
+            self.pattern_combo.addItems([name for name, _ in patterns_table.get_all_patterns()])
+            self._patterns_version = patterns_table.version
 
     # ---------- GENERATION METHODS ----------
     def _generate_single_word(self):
@@ -256,11 +258,11 @@ class EnhancedGenerationWidget(QWidget):
             <table style='width:100%; border-collapse:collapse;'>
                 <tr style='background:#6B5B95; color:white;'><th>الوزن</th><th>الكلمة</th></tr>
         """
-        for i, (pattern, word) in enumerate(results):
-            bg = '#F5EFE6' if i % 2 == 0 else 'white'
-            html += f"<tr style='background:{bg};'><td style='padding:8px;'>{pattern}</td><td style='padding:8px; font-size:14pt;'><b>{word}</b></td></tr>"
-        html += "</table></div>"
-        self.results_box.setHtml(html)
+        rows = [
+            f"<tr style='background:{'#F5EFE6' if i % 2 == 0 else 'white'};'><td style='padding:8px;'>{pattern}</td><td style='padding:8px; font-size:14pt;'><b>{word}</b></td></tr>"
+            for i, (pattern, word) in enumerate(results)
+        ]
+        self.results_box.setHtml(html + "".join(rows) + "</table></div>")
 
 
 # ============================================================================
@@ -387,15 +389,16 @@ class EnhancedValidationWidget(QWidget):
         """
         if is_valid:
             if 'matches' in result:
-                html += "<tr><td colspan='2' style='padding:10px; font-weight:bold;'>المشتقات المطابقة:</td></tr>"
+                parts = ["<tr><td colspan='2' style='padding:10px; font-weight:bold;'>المشتقات المطابقة:</td></tr>"]
                 for i, match in enumerate(result['matches'], 1):
                     bg = '#F5EFE6' if i % 2 == 0 else 'white'
-                    html += f"""
+                    parts.append(f"""
                     <tr style='background:{bg};'>
                         <td style='padding:10px;'>الوزن {i}:</td>
                         <td style='padding:10px;'>{match['pattern']} (الجذر: {match['root']})</td>
                     </tr>
-                    """
+                    """)
+                html += "".join(parts)
             else:
                 html += f"""
                 <tr><td style='padding:10px; font-weight:bold;'>الجذر:</td><td>{result.get('root','غير محدد')}</td></tr>
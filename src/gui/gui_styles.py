@@ -296,6 +296,23 @@ class AppStyles:
             border: 2px solid {AppStyles.COLORS['border']};
             border-radius: 12px;
         }}
+        
+        /* Dashboard stat cards */
+        QLabel#statIcon {{
+            font-size: 36pt;
+        }}
+        
+        QLabel#statValue {{
+            font-size: 18pt;
+            font-weight: bold;
+            color: {AppStyles.COLORS['text_primary']};
+        }}
+        
+        QLabel#statText {{
+            font-size: 14pt;
+            font-weight: bold;
+            color: {AppStyles.COLORS['text_secondary']};
+        }}
         """
     
     @staticmethod
@@ -77,9 +77,9 @@ class PatternValidationDialog(QDialog):
             return
 
         is_valid, message = self.engine.validate_pattern_template(template)
-        if is_valid:
-            self.result_label.setText(f"✅ {message}")
-            self.result_label.setStyleSheet("color: #4CAF50; font-weight: bold; padding: 10px;")
-        else:
-            self.result_label.setText(f"❌ {message}")
-            self.result_label.setStyleSheet("color: #F44336; font-weight: bold; padding: 10px;")
\ No newline at end of file
+        self.result_label.setText(f"✅ {message}" if is_valid else f"❌ {message}")
+        # Restyling re-polishes the label: only do it when the verdict flips
+        if is_valid != getattr(self, '_result_valid', None):
+            color = "#4CAF50" if is_valid else "#F44336"
+            self.result_label.setStyleSheet(f"color: {color}; font-weight: bold; padding: 10px;")
+            self._result_valid = is_valid
\ No newline at end of file
@@ -69,19 +69,13 @@ class RootAnalysisDialog(QDialog):
         layout.addWidget(table)
 
         # ----- Example Roots -----
-        examples = RootClassifier.get_examples()
-        example_text = ""
+        roots = None
         if self.analysis.subtype:
-            for cat, roots in examples.items():
-                if self.analysis.subtype in cat:
-                    example_text = "📚 أمثلة: " + "، ".join(roots[:5])
-                    break
-        if not example_text and self.analysis.category:
+            roots = RootClassifier.find_examples(self.analysis.subtype)
+        if not roots and self.analysis.category:
             # Fallback: show examples of the main category
-            for cat, roots in examples.items():
-                if self.analysis.category.value in cat:
-                    example_text = "📚 أمثلة: " + "، ".join(roots[:5])
-                    break
+            roots = RootClassifier.find_examples(self.analysis.category.value)
+        example_text = "📚 أمثلة: " + "، ".join(roots[:5]) if roots else ""
 
         if example_text:
             example_label = QLabel(example_text)
@@ -13,6 +13,7 @@ from .tree_visualizer import AVLTreeVisualizer
 
 class TreeOperationsDialog(QDialog):
     """Dialog for exploring AVL tree structure and statistics."""
+    ROOTS_PAGE = 500  # Roots shown per page of the inorder list
 
     def __init__(self, engine, parent=None):
         super().__init__(parent)
@@ -54,14 +55,10 @@ class TreeOperationsDialog(QDialog):
             </table>
         """
 
-        # Inorder list
-        roots = self.engine.roots_tree.display_inorder()
-        if roots:
-            info_text += "<h3 style='color: #6B5B95; margin-top: 20px;'>📋 قائمة الجذور (ترتيب تصاعدي)</h3>"
-            info_text += "<p style='font-family: monospace; font-size: 11pt; line-height: 1.6;'>"
-            info_text += " – ".join(roots)
-            info_text += "</p>"
-        else:
+        # Inorder list, rendered one page at a time
+        self._roots = self.engine.roots_tree.display_inorder()
+        self._roots_page = 0
+        if not self._roots:
             info_text += "<p><i>الشجرة فارغة</i></p>"
 
         info_text += "</div>"
@@ -73,6 +70,29 @@ class TreeOperationsDialog(QDialog):
         info_label.setStyleSheet("background-color: #F5EFE6; border-radius: 8px; padding: 15px;")
 
         stats_layout.addWidget(info_label)
+
+        if self._roots:
+            self.roots_label = QLabel()
+            self.roots_label.setTextFormat(Qt.TextFormat.RichText)
+            self.roots_label.setWordWrap(True)
+            self.roots_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+            self.roots_label.setStyleSheet("background-color: #F5EFE6; border-radius: 8px; padding: 15px;")
+            stats_layout.addWidget(self.roots_label)
+
+            page_layout = QHBoxLayout()
+            self.prev_btn = QPushButton("→ السابق")
+            self.prev_btn.clicked.connect(lambda: self._show_roots_page(self._roots_page - 1))
+            self.next_btn = QPushButton("التالي ←")
+            self.next_btn.clicked.connect(lambda: self._show_roots_page(self._roots_page + 1))
+            page_layout.addStretch()
+            page_layout.addWidget(self.prev_btn)
+            page_layout.addWidget(self.next_btn)
+            page_layout.addStretch()
+            stats_layout.addLayout(page_layout)
+            self.prev_btn.setVisible(len(self._roots) > self.ROOTS_PAGE)
+            self.next_btn.setVisible(len(self._roots) > self.ROOTS_PAGE)
+            self._show_roots_page(0)
+
         stats_layout.addStretch()
 
         # ----- Tab 2: Tree Visualizer -----
@@ -107,4 +127,21 @@ class TreeOperationsDialog(QDialog):
         btn_holder.addStretch()
         layout.addLayout(btn_holder)
 
-        self.setLayout(layout)
\ No newline at end of file
+        self.setLayout(layout)
+
+    def _show_roots_page(self, page):
+        """Show one page of the inorder root list."""
+        total = len(self._roots)
+        last_page = (total - 1) // self.ROOTS_PAGE
+        self._roots_page = page = max(0, min(page, last_page))
+        start = page * self.ROOTS_PAGE
+        end = min(start + self.ROOTS_PAGE, total)
+
+        self.roots_label.setText(
+            "<div style='direction: rtl;'>"
+            f"<h3 style='color: #6B5B95;'>📋 قائمة الجذور (ترتيب تصاعدي) – {start + 1}-{end} من {total}</h3>"
+            "<p style='font-family: monospace; font-size: 11pt; line-height: 1.6;'>"
+            f"{' – '.join(self._roots[start:end])}</p></div>"
+        )
+        self.prev_btn.setEnabled(page > 0)
+        self.next_btn.setEnabled(page < last_page)
\ No newline at end of file
@@ -21,10 +21,17 @@ class AVLTreeVisualizer(QGraphicsView):
         self.setBackgroundBrush(QBrush(QColor("#F5EFE6")))
         self.node_radius = 25
         self.level_height = 80
-        self.refresh()
+        self._needs_refresh = True  # Drawn on first show, not at construction
+
+    def showEvent(self, event):
+        """Draw the tree the first time the view becomes visible."""
+        super().showEvent(event)
+        if self._needs_refresh:
+            self.refresh()
 
     def refresh(self):
         """Redraw the tree from root."""
+        self._needs_refresh = False
         self.scene.clear()
         if self.tree.root is None:
             text = self.scene.addText("🌳 الشجرة فارغة")
@@ -25,6 +25,8 @@ class HashTable:
         self.size = 0
         self.buckets = [None] * self.capacity
         self.load_factor_threshold = 0.75
+        self.version = 0  # Bumped on every insert/update/delete
+        self._patterns_cache = None  # (version, get_all_patterns() list)
 
     def hash_function(self, key: str) -> int:
         """Polynomial rolling hash for Arabic strings."""
@@ -38,6 +40,7 @@ class HashTable:
         """Insert or update a pattern."""
         if self.size / self.capacity >= self.load_factor_threshold:
             self._resize()
+        self.version += 1
 
         index = self.hash_function(key)
         entry = self.buckets[index]
@@ -78,6 +81,7 @@ class HashTable:
                 else:
                     prev.next = entry.next
                 self.size -= 1
+                self.version += 1
                 return True
             prev = entry
             entry = entry.next
@@ -121,12 +125,18 @@ class HashTable:
         return stats
 
     def get_all_patterns(self) -> list:
+        """All (name, data) pairs; cached until the next change (do not modify)."""
+        cache = self._patterns_cache
+        if cache is not None and cache[0] == self.version:
+            return cache[1]
+
         patterns = []
         for i in range(self.capacity):
             entry = self.buckets[i]
             while entry:
                 patterns.append((entry.key, entry.value))
                 entry = entry.next
+        self._patterns_cache = (self.version, patterns)
         return patterns
 
     def __len__(self) -> int:
@@ -29,10 +29,23 @@ from hash_table import HashTable
 from arabic_utils import ArabicUtils
 from morphology import MorphologicalEngine
 from root_classifier import RootClassifier, RootAnalysis
+from pattern_manager import read_json_file
 
 
 console = Console()
 
+# Static part of the statistics screen, printed in one call
+STATS_FOOTER = "\n".join([
+    "\n[bold]AVL Tree Information:[/bold]",
+    "  • Search complexity: O(log n) - Efficient!",
+    "  • Self-balancing: Yes - Maintains height balance",
+    "  • Operations: Insert, Search, Delete in O(log n)",
+    "\n[bold]Hash Table Information:[/bold]",
+    "  • Average search: O(1) - Constant time!",
+    "  • Collision resolution: Separate chaining",
+    "  • Dynamic resizing: When load factor > 0.75"
+])
+
 class ArabicMorphologyCLI:
     """Command Line Interface for Arabic Morphological Engine."""
     
@@ -63,7 +76,8 @@ class ArabicMorphologyCLI:
             # Load roots
             if os.path.exists(roots_path):
                 with open(roots_path, "r", encoding="utf-8") as f:
-                    roots = [line.strip() for line in f if line.strip()]
+                    # One bulk read; text mode already turned \r\n into \n
+                    roots = list(filter(None, map(str.strip, f.read().split('\n'))))
                     
                     if roots:
                         self.engine.load_roots(roots)
@@ -77,18 +91,17 @@ class ArabicMorphologyCLI:
             
             # Load patterns
             if os.path.exists(patterns_path):
-                with open(patterns_path, "r", encoding="utf-8") as f:
-                    try:
-                        patterns = json.load(f)
-                        if patterns and isinstance(patterns, dict):
-                            self.engine.load_patterns(patterns)
-                            patterns_count = len(patterns)
-                            patterns_loaded = True
-                            console.print(f"[green]✅ Loaded patterns from patterns.json ({patterns_count} patterns)[/green]")
-                        else:
-                            console.print("[yellow]📭 patterns.json is empty or invalid.[/yellow]")
-                    except json.JSONDecodeError as e:
+                try:
+                    patterns = read_json_file(patterns_path)
+                    if patterns and isinstance(patterns, dict):
+                        self.engine.load_patterns(patterns)
+                        patterns_count = len(patterns)
+                        patterns_loaded = True
+                        console.print(f"[green]✅ Loaded patterns from patterns.json ({patterns_count} patterns)[/green]")
+                    else:
                         console.print("[yellow]📭 patterns.json is empty or invalid.[/yellow]")
+                except json.JSONDecodeError as e:
+                    console.print("[yellow]📭 patterns.json is empty or invalid.[/yellow]")
             else:
                 console.print("[yellow]⚠️  patterns.json file not found.[/yellow]")
             
@@ -288,7 +301,7 @@ class ArabicMorphologyCLI:
             console.print(f"[green]✅ Root '{root}' (normalized to '{normalized_root}') added successfully![/green]")
             
             # Analyze it
-            analysis = RootClassifier.classify(normalized_root)
+            analysis = RootClassifier.classify_cached(normalized_root)
             console.print(f"📊 Root type: {analysis.subtype}")
             
             if not Confirm.ask("Add another root?"):
@@ -898,17 +911,8 @@ class ArabicMorphologyCLI:
         
         console.print(table)
         
-        # AVL tree info
-        console.print("\n[bold]AVL Tree Information:[/bold]")
-        console.print(f"  • Search complexity: O(log n) - Efficient!")
-        console.print(f"  • Self-balancing: Yes - Maintains height balance")
-        console.print(f"  • Operations: Insert, Search, Delete in O(log n)")
-        
-        # Hash table info
-        console.print("\n[bold]Hash Table Information:[/bold]")
-        console.print(f"  • Average search: O(1) - Constant time!")
-        console.print(f"  • Collision resolution: Separate chaining")
-        console.print(f"  • Dynamic resizing: When load factor > 0.75")
+        # AVL tree and hash table info
+        console.print(STATS_FOOTER)
 
 
     # Update the tree_operations method in main.py
@@ -1090,7 +1094,7 @@ class ArabicMorphologyCLI:
         normalized_root = ArabicUtils.normalize_arabic(root, aggressive=False, expand_shadda=True) 
   
         # Analyze the normalized root
-        analysis = RootClassifier.classify(normalized_root)
+        analysis = RootClassifier.classify_cached(normalized_root)
 
         # Display analysis
         table = Table(title=f"Root Analysis: {root} ( normalized: {normalized_root} )")
@@ -1120,12 +1124,10 @@ class ArabicMorphologyCLI:
         console.print(table)
         
         # Show examples of similar roots
-        examples = RootClassifier.get_examples()
-        for category, roots_list in examples.items():
-            if analysis.subtype and analysis.subtype in category:
-                console.print(f"\n📚 Examples of {analysis.subtype}:")
-                console.print(", ".join(roots_list))
-                break
+        roots_list = RootClassifier.find_examples(analysis.subtype) if analysis.subtype else None
+        if roots_list:
+            console.print(f"\n📚 Examples of {analysis.subtype}:")
+            console.print(", ".join(roots_list))
         
         # Test generation with this root
         if Confirm.ask("\nGenerate words with this root to see pattern adjustments?"):
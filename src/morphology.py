@@ -12,18 +12,40 @@ Date: [Today's Date]
 
 from typing import Dict, List, Tuple, Optional, Any
 from avl_tree import AVLTree, AVLNode
+from sorted_roots import SortedListRoots, SortedDictRoots, SORTED_ROOTS_AVAILABLE
 from hash_table import HashTable
 from arabic_utils import ArabicUtils
+from pattern_trie import ArabicPatternTrie
 from pattern_manager import PatternManager
 from root_classifier import RootClassifier
 
+# Storage backend for roots:
+# - 'sorted_list': bisect-maintained sorted list + dict (default, fastest at this size)
+# - 'avl': the AVL tree
+# - 'sorted_dict': sortedcontainers.SortedDict (falls back to 'sorted_list' if unavailable)
+ROOTS_BACKEND = 'sorted_list'
+
 class MorphologicalEngine:
     """Main engine for Arabic morphological operations."""
     
-    def __init__(self):
-        """Initialize the morphological engine with empty data structures."""
-        self.roots_tree = AVLTree()
+    def __init__(self, roots_backend: Optional[str] = None):
+        """
+        Initialize the morphological engine with empty data structures.
+        
+        Args:
+            roots_backend (str, optional): Override ROOTS_BACKEND
+        """
+        backend = roots_backend or ROOTS_BACKEND
+        if backend == 'avl':
+            self.roots_tree = AVLTree()
+        elif backend == 'sorted_dict' and SORTED_ROOTS_AVAILABLE:
+            self.roots_tree = SortedDictRoots()
+        elif backend in ('sorted_list', 'sorted_dict'):
+            self.roots_tree = SortedListRoots()
+        else:
+            raise ValueError(f"Unknown roots backend: {backend}")
         self.patterns_table = HashTable()
+        self._pattern_trie = None  # (patterns_table.version, ArabicPatternTrie)
         self.pattern_manager = PatternManager(self.patterns_table)
 
     def root_exists(self, root: str) -> bool:
@@ -49,8 +71,8 @@ class MorphologicalEngine:
         """
         # print(f"📥 Loading {len(roots)} roots into AVL tree...")
         
-        for root in roots:
-            if ArabicUtils.is_valid_root(root):
+        for root, is_valid in zip(roots, ArabicUtils.validate_roots(roots)):
+            if is_valid:
                 self.roots_tree.insert(root)
         
         # print(f"✅ Loaded {self.roots_tree.count_nodes()} roots into AVL tree")
@@ -121,6 +143,24 @@ class MorphologicalEngine:
             # Try to find matching root and pattern
             return self._find_matching_root_and_pattern(normalized_word)
     
+    def _get_pattern_trie(self, all_patterns: List[Tuple[str, Dict]]) -> ArabicPatternTrie:
+        """
+        Get the trie of all pattern templates, rebuilt only when the table changes.
+        
+        Args:
+            all_patterns (List[Tuple]): Current patterns_table.get_all_patterns()
+            
+        Returns:
+            ArabicPatternTrie: Trie whose values are indices into all_patterns
+        """
+        version = self.patterns_table.version
+        if self._pattern_trie is None or self._pattern_trie[0] != version:
+            trie = ArabicPatternTrie()
+            for pattern_index, (pattern_name, pattern_data) in enumerate(all_patterns):
+                trie.insert(pattern_data.get('template', ''), pattern_index)
+            self._pattern_trie = (version, trie)
+        return self._pattern_trie[1]
+    
     def _validate_against_root(self, word: str, root: str) -> Dict[str, Any]:
         """
         Validate word against a specific root.
@@ -183,29 +223,59 @@ class MorphologicalEngine:
         Returns:
             Dict: Matching results
         """
+        if not word:
+            # Nothing Arabic left after normalization: no root or pattern can match
+            return {
+                'word': word,
+                'is_valid': False,
+                'possible_roots': [],
+                'message': "No derivation found. Possible roots: []"
+            }
+        
         # Get all patterns
         all_patterns = self.patterns_table.get_all_patterns()
         
-        # Try all roots in the tree (this is computationally expensive)
-        # For demonstration, we'll use a smarter approach
         all_roots = self.roots_tree.display_inorder()
         
         print(f"🔍 Searching for matches among {len(all_roots)} roots and {len(all_patterns)} patterns...")
         
-        matches = []
+        # Index roots by their aggressive form so trie hits map straight to roots
+        roots_by_key: Dict[str, List[int]] = {}
+        aggressive_roots = []
+        for position, root in enumerate(all_roots):
+            key = ArabicUtils.normalize_arabic(root, aggressive=True)
+            aggressive_roots.append(key)
+            roots_by_key.setdefault(key, []).append(position)
+        
+        # One trie walk over the word replaces the roots x patterns scan
+        trie = self._get_pattern_trie(all_patterns)
+        
+        found = set()
+        for pattern_index, letters in trie.match(word):
+            if None in letters:
+                # Template skips a root position: check every compatible root
+                candidates = [
+                    position for position, key in enumerate(aggressive_roots)
+                    if len(key) == 3 and all(l is None or l == c for l, c in zip(letters, key))
+                ]
+            else:
+                candidates = roots_by_key.get(''.join(letters), [])
+            
+            template = all_patterns[pattern_index][1].get('template', '')
+            for position in candidates:
+                # Final check keeps the exact find_pattern_match semantics
+                if ArabicUtils.find_pattern_match(word, all_roots[position], template):
+                    found.add((position, pattern_index))
         
-        # Try common roots first (optional optimization)
-        for root in all_roots:
-            for pattern_name, pattern_data in all_patterns:
-                template = pattern_data.get('template', '')
-                
-                if ArabicUtils.find_pattern_match(word, root, template):
-                    matches.append({
-                        'root': root,
-                        'pattern': pattern_name,
-                        'template': template,
-                        'description': pattern_data.get('description', '')
-                    })
+        matches = []
+        for position, pattern_index in sorted(found):
+            pattern_name, pattern_data = all_patterns[pattern_index]
+            matches.append({
+                'root': all_roots[position],
+                'pattern': pattern_name,
+                'template': pattern_data.get('template', ''),
+                'description': pattern_data.get('description', '')
+            })
         
         if matches:
             return {
@@ -258,26 +328,17 @@ class MorphologicalEngine:
     
     def get_engine_statistics(self) -> Dict[str, Any]:
         """Get overall statistics."""
-        total_roots = self.roots_tree.count_nodes()
         total_patterns = len(self.patterns_table)
-    
-    # Calculate derivatives across all nodes
-        total_derivatives = 0
-        roots_with_derivatives = 0
-    
-        all_nodes = self.roots_tree.get_all_nodes()
-        for node in all_nodes:
-            deriv_count = node.get_derivative_count()
-            if deriv_count > 0:
-                roots_with_derivatives += 1
-                total_derivatives += deriv_count
-    
+        
+        # Counts, height and derivative totals from a single tree pass
+        tree_stats = self.roots_tree.get_tree_stats()
+        
         return {
-            'roots_count': total_roots,
+            'roots_count': tree_stats['count'],
             'patterns_count': total_patterns,
-            'generated_words_count': total_derivatives,  # ✅ Now calculated
-            'unique_roots_with_generated': roots_with_derivatives,  # ✅ Now calculated
-            'avl_tree_height': self.roots_tree.get_tree_height(),
+            'generated_words_count': tree_stats['total_derivatives'],
+            'unique_roots_with_generated': tree_stats['with_derivatives'],
+            'avl_tree_height': tree_stats['height'],
             'hash_table_load_factor': self.patterns_table.display_stats().get('load_factor', 0)
         }
     
@@ -306,16 +367,19 @@ class MorphologicalEngine:
             ))
         
         # Simple text table
-        output = "=" * 60 + "\n"
-        output += f"{'Root':<10} {'Pattern':<15} {'Generated Word':<20} {'Valid'}\n"
-        output += "=" * 60 + "\n"
-        
-        for root, pattern, word, valid in table_data:
-            output += f"{root:<10} {pattern:<15} {word:<20} {valid}\n"
-        
-        output += "=" * 60
-        
-        return output
+        separator = "=" * 60
+        lines = [
+            separator,
+            f"{'Root':<10} {'Pattern':<15} {'Generated Word':<20} {'Valid'}",
+            separator,
+        ]
+        lines.extend(
+            f"{root:<10} {pattern:<15} {word:<20} {valid}"
+            for root, pattern, word, valid in table_data
+        )
+        lines.append(separator)
+        
+        return "\n".join(lines)
     
     def export_results(self, format: str = 'text') -> str:
         """
@@ -332,7 +396,7 @@ class MorphologicalEngine:
         all_roots = self.roots_tree.display_inorder()
 
         for root in all_roots:
-            node = self.roots_tree.search(root)
+            node = self.roots_tree.lookup(root)
             if node:
                 for derivative in node.get_derivatives():
                     all_derivatives.append({
@@ -362,16 +426,19 @@ class MorphologicalEngine:
             return "No derivatives to display."
         
         # Prepare data for table display
-        output = "=" * 70 + "\n"
-        output += f"{'Root':<10} {'Pattern':<15} {'Word':<20} {'Frequency'}\n"
-        output += "=" * 70 + "\n"
-        
-        for item in derivatives:
-            output += f"{item['root']:<10} {item['pattern']:<15} {item['word']:<20} {item['frequency']}\n"
-        
-        output += "=" * 70
-        
-        return output
+        separator = "=" * 70
+        lines = [
+            separator,
+            f"{'Root':<10} {'Pattern':<15} {'Word':<20} {'Frequency'}",
+            separator,
+        ]
+        lines.extend(
+            f"{item['root']:<10} {item['pattern']:<15} {item['word']:<20} {item['frequency']}"
+            for item in derivatives
+        )
+        lines.append(separator)
+        
+        return "\n".join(lines)
     
 
     def remove_derivative(self, root: str, word: str, pattern: str = None) -> bool:
@@ -445,7 +512,9 @@ class MorphologicalEngine:
         try:
             # Generate the word
             if consider_root_type:
-                generated_word = RootClassifier.generate_with_root_type(
+                # The word itself is memoized; storing the derivative below still
+                # happens on every call, so frequencies keep counting
+                generated_word = RootClassifier.generate_cached(
                     root, template, pattern_name
                 )
             else:
@@ -4,10 +4,37 @@ DEBUG VERSION with console output.
 """
 
 import json
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from hash_table import HashTable
 from arabic_utils import ArabicUtils
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # Optional dependency
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def read_json_file(filepath: str) -> Any:
+    """
+    Parse a JSON file, with orjson when it is installed.
+    
+    Both parsers give the same dicts/lists, and orjson's decode error is a
+    json.JSONDecodeError, so callers handle failures the same way.
+    
+    Args:
+        filepath (str): Path to a UTF-8 JSON file
+        
+    Returns:
+        Any: Parsed JSON data
+    """
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 
 class PatternManager:
     """Manages Arabic morphological patterns with validation."""
@@ -117,8 +144,7 @@ class PatternManager:
 
     def import_patterns(self, filepath: str) -> Tuple[bool, str]:
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                patterns = json.load(f)
+            patterns = read_json_file(filepath)
             count = 0
             errors = []
             for name, data in patterns.items():
@@ -0,0 +1,124 @@
+"""
+Trie of morphological pattern templates.
+
+Features:
+- Templates stored by their literal skeleton, root positions act as wildcards
+- One walk over a word finds every template (and root letters) it can match
+- Works on aggressively normalized text, like find_pattern_match
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from arabic_utils import normalize_arabic, _compile_pattern
+
+
+# Stand-ins for root positions 1, 2, 3 while a template is normalized.
+# Arabic-Indic digits survive normalization untouched and can never be
+# template literals (digits are always root positions).
+_ROOT_SENTINELS = ('٠', '١', '٢')
+_SENTINEL_INDEX = {s: i for i, s in enumerate(_ROOT_SENTINELS)}
+
+
+class PatternTrieNode:
+    """Node in the pattern trie."""
+
+    def __init__(self):
+        self.children: Dict[str, 'PatternTrieNode'] = {}   # literal edges
+        self.wildcards: Dict[int, 'PatternTrieNode'] = {}  # root index edges
+        self.values: List[object] = []                     # templates ending here
+
+
+class ArabicPatternTrie:
+    """Trie matching words against many pattern templates in one walk."""
+
+    def __init__(self):
+        self.root = PatternTrieNode()
+        self.size = 0
+
+    @staticmethod
+    def template_skeleton(pattern_template: str) -> Optional[Tuple[object, ...]]:
+        """
+        Normalize a template the way generated words are normalized.
+
+        Literal letters become characters, root positions become ints
+        (0, 1, 2). Shadda after a root position repeats the wildcard.
+
+        Returns:
+            Optional[Tuple]: Skeleton, or None if the template is invalid
+        """
+        try:
+            ops = _compile_pattern(pattern_template)
+        except ValueError:
+            return None
+
+        marked = ''.join(_ROOT_SENTINELS[v] if k else v for k, v in ops)
+        normalized = normalize_arabic(marked, aggressive=True, expand_shadda=True)
+        return tuple(_SENTINEL_INDEX.get(c, c) for c in normalized)
+
+    def insert(self, pattern_template: str, value: object = None) -> bool:
+        """
+        Insert a pattern template.
+
+        Args:
+            pattern_template (str): Pattern template (e.g., "1ا23")
+            value: Payload returned on match (defaults to the template)
+
+        Returns:
+            bool: False if the template is invalid and was skipped
+        """
+        skeleton = self.template_skeleton(pattern_template)
+        if skeleton is None:
+            return False
+
+        node = self.root
+        for step in skeleton:
+            edges = node.wildcards if isinstance(step, int) else node.children
+            child = edges.get(step)
+            if child is None:
+                child = edges[step] = PatternTrieNode()
+            node = child
+
+        node.values.append(pattern_template if value is None else value)
+        self.size += 1
+        return True
+
+    def match(self, word: str) -> Iterator[Tuple[object, Tuple[Optional[str], ...]]]:
+        """
+        Find every template the word fits.
+
+        Args:
+            word (str): Arabic word (normalized aggressively inside)
+
+        Yields:
+            (value, root_letters): root_letters has one entry per root
+            position; None where the template never uses that position
+        """
+        word = normalize_arabic(word, aggressive=True, expand_shadda=True)
+        n = len(word)
+
+        # Iterative DFS: (node, position in word, bound root letters)
+        stack = [(self.root, 0, (None, None, None))]
+        while stack:
+            node, i, bound = stack.pop()
+
+            if i == n:
+                for value in node.values:
+                    yield value, bound
+                continue
+
+            char = word[i]
+            child = node.children.get(char)
+            if child is not None:
+                stack.append((child, i + 1, bound))
+
+            for index, child in node.wildcards.items():
+                letter = bound[index]
+                if letter is None:
+                    new_bound = bound[:index] + (char,) + bound[index + 1:]
+                    stack.append((child, i + 1, new_bound))
+                elif letter == char:
+                    # Repeated root position must repeat the same letter
+                    stack.append((child, i + 1, bound))
+
+    def __len__(self) -> int:
+        return self.size
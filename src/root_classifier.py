@@ -12,6 +12,7 @@ Date: [Today's Date]
 """
 
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
@@ -21,10 +22,16 @@ class RootClassifier:
     """Classifies Arabic triliteral roots into morphological categories."""
     
     # Weak letters (و ي ا)
-    WEAK_LETTERS = {'و', 'ي', 'ا', 'ى'}
+    WEAK_LETTERS = frozenset({'و', 'ي', 'ا', 'ى'})
     
     # Hamza letters and their forms
-    HAMZA_LETTERS = {'ء', 'أ', 'إ', 'آ', 'ؤ', 'ئ'}
+    HAMZA_LETTERS = frozenset({'ء', 'أ', 'إ', 'آ', 'ؤ', 'ئ'})
+    
+    # Hamza variants -> standard hamza, applied in one str.translate pass
+    _HAMZA_FOLD_TABLE = str.maketrans({
+        'أ': 'ء', 'إ': 'ء', 'آ': 'ء',
+        'ؤ': 'ء', 'ئ': 'ء'
+    })
     
     # All possible hamza forms for matching
     HAMZA_VARIANTS = {
@@ -56,8 +63,8 @@ class RootClassifier:
                 root=root,
                 category=RootCategory.UNKNOWN,
                 subtype=None,
-                weak_positions=[],
-                hamza_positions=[],
+                weak_positions=(),
+                hamza_positions=(),
                 is_doubled=False,
                 description=f"Invalid root length after normalization: {len(normalized_root)}"
             )
@@ -93,38 +100,77 @@ class RootClassifier:
         )
             
     
+    @staticmethod
+    def classify_cached(root: str) -> RootAnalysis:
+        """
+        Classify a root, reusing earlier results for the same string.
+        
+        RootAnalysis is immutable, so one instance can be shared by every
+        caller (repeated analyses, generation over many patterns, ...).
+        
+        Args:
+            root (str): Arabic root (3 letters, may include shadda)
+            
+        Returns:
+            RootAnalysis: Complete analysis of the root
+        """
+        return _classify_cached(root)
+    
+    @staticmethod
+    def count_categories(roots: List[str], assume_normalized: bool = False) -> Dict[RootCategory, int]:
+        """
+        Count roots per main category in a single pass.
+        
+        Gives the same categories as classify(), but only the category:
+        no RootAnalysis objects, subtypes or descriptions are built.
+        
+        Args:
+            roots (List[str]): Arabic roots
+            assume_normalized (bool): Skip normalization when the roots are
+                                      already normalized (e.g. taken from the AVL tree)
+            
+        Returns:
+            Dict[RootCategory, int]: Number of roots in each category
+        """
+        if not assume_normalized:
+            roots = ArabicUtils.normalize_arabic_batch(roots, aggressive=False, expand_shadda=True)
+        
+        hamza_letters = RootClassifier.HAMZA_LETTERS
+        weak_letters = RootClassifier.WEAK_LETTERS
+        counts = dict.fromkeys(RootCategory, 0)
+        
+        for root in roots:
+            if len(root) != 3:
+                category = RootCategory.UNKNOWN
+            elif not hamza_letters.isdisjoint(root):
+                category = RootCategory.HAMZATED
+            elif root[1] == root[2] and root[1] not in weak_letters:
+                category = RootCategory.DOUBLED
+            elif not weak_letters.isdisjoint(root):
+                category = RootCategory.WEAK
+            else:
+                category = RootCategory.SOUND
+            counts[category] += 1
+        
+        return counts
+    
     @staticmethod
     def _normalize_for_analysis(root: str) -> str:
         """Normalize root for analysis."""
         # Replace hamza variants with standard hamza for consistent analysis
-        hamza_map = {
-            'أ': 'ء', 'إ': 'ء', 'آ': 'ء',
-            'ؤ': 'ء', 'ئ': 'ء'
-        }
-        
-        normalized = root
-        for variant, standard in hamza_map.items():
-            normalized = normalized.replace(variant, standard)
-        
-        return normalized
+        return root.translate(RootClassifier._HAMZA_FOLD_TABLE)
     
     @staticmethod
     def _find_hamza_positions(root: str) -> List[int]:
         """Find positions of hamza in root."""
-        positions = []
-        for i, char in enumerate(root):
-            if char in RootClassifier.HAMZA_LETTERS:
-                positions.append(i)
-        return positions
+        hamza_letters = RootClassifier.HAMZA_LETTERS
+        return [i for i, char in enumerate(root) if char in hamza_letters]
     
     @staticmethod
     def _find_weak_positions(root: str) -> List[int]:
         """Find positions of weak letters in root."""
-        positions = []
-        for i, char in enumerate(root):
-            if char in RootClassifier.WEAK_LETTERS:
-                positions.append(i)
-        return positions
+        weak_letters = RootClassifier.WEAK_LETTERS
+        return [i for i, char in enumerate(root) if char in weak_letters]
     
     @staticmethod
     def _determine_category(root: str, hamza_positions: List[int], 
@@ -206,6 +252,21 @@ class RootClassifier:
             "مضعف": ["مدّ", "شدّ", "فرّ", "حبّ"]
         }
     
+    @staticmethod
+    def find_examples(name: str) -> Optional[Tuple[str, ...]]:
+        """
+        Get the example roots of the first category whose name contains `name`.
+        
+        The lookup is cached, so repeated analyses do not rescan get_examples().
+        
+        Args:
+            name (str): Root subtype or category value (e.g. "أجوف", "مهموز")
+            
+        Returns:
+            Optional[Tuple[str, ...]]: Example roots, or None if no category matches
+        """
+        return _find_examples(name)
+    
     @staticmethod
     def get_pattern_adjustments(root_type: str) -> Dict[str, str]:
         """
@@ -294,7 +355,7 @@ class RootClassifier:
 
         normalized_root = ArabicUtils.normalize_arabic(root, aggressive=False, expand_shadda=True)
         # Classify the root
-        analysis = RootClassifier.classify(normalized_root)
+        analysis = RootClassifier.classify_cached(normalized_root)
                 
         # Generate basic word
         basic_word = ArabicUtils.apply_pattern(normalized_root, pattern_template)
@@ -306,6 +367,24 @@ class RootClassifier:
         
         return transformed_word
     
+    @staticmethod
+    def generate_cached(root: str, pattern_template: str, pattern_name: str = "") -> str:
+        """
+        Generate word with root type consideration, reusing earlier results.
+        
+        generate_with_root_type only depends on its arguments, so repeated
+        generations of the same root and pattern are served from a cache.
+        
+        Args:
+            root (str): Arabic root
+            pattern_template (str): Pattern template
+            pattern_name (str): Pattern name for specific rules
+            
+        Returns:
+            str: Generated word
+        """
+        return _generate_cached(root, pattern_template, pattern_name)
+    
     @staticmethod
     def _transform_by_root_type(word: str, root: str, pattern: str, 
                                pattern_name: str, analysis) -> str:
@@ -433,4 +512,25 @@ class RootClassifier:
         
         # For مفعول pattern - keep as is (already works)
         
-        return result
\ No newline at end of file
+        return result
+
+
+@lru_cache(maxsize=4096)
+def _classify_cached(root: str) -> RootAnalysis:
+    """Cached RootClassifier.classify (see RootClassifier.classify_cached)."""
+    return RootClassifier.classify(root)
+
+
+@lru_cache(maxsize=4096)
+def _generate_cached(root: str, pattern_template: str, pattern_name: str) -> str:
+    """Cached RootClassifier.generate_with_root_type (see RootClassifier.generate_cached)."""
+    return RootClassifier.generate_with_root_type(root, pattern_template, pattern_name)
+
+
+@lru_cache(maxsize=64)
+def _find_examples(name: str) -> Optional[Tuple[str, ...]]:
+    """Cached example lookup (see RootClassifier.find_examples)."""
+    for category, roots in RootClassifier.get_examples().items():
+        if name in category:
+            return tuple(roots)
+    return None
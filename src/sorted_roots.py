@@ -0,0 +1,195 @@
+"""
+Sorted-container storage for Arabic roots.
+
+Drop-in alternatives to AVLTree for the engine's access pattern
+(insert at load time, point lookup, in-order iteration):
+- SortedListRoots: a plain sorted list maintained with bisect.insort
+  plus a root -> AVLNode dict (no extra dependency)
+- SortedDictRoots: a sortedcontainers.SortedDict mapping root -> AVLNode
+
+Both keep the AVLNode objects, so derivatives and everything built on
+them stay unchanged. The tree views (root, get_tree_structure,
+display_tree_ascii, ...) are served from a perfectly balanced tree
+linked over the sorted nodes on demand.
+
+Author: [Your Name]
+Date: [Today's Date]
+"""
+
+from bisect import insort
+
+from arabic_utils import ArabicUtils
+from avl_tree import AVLTree, AVLNode
+
+try:
+    from sortedcontainers import SortedDict
+    SORTED_ROOTS_AVAILABLE = True
+except ImportError:  # Optional dependency
+    SortedDict = None
+    SORTED_ROOTS_AVAILABLE = False
+
+
+class SortedListRoots(AVLTree):
+    """Arabic roots kept in a bisect-maintained list, with the AVLTree interface."""
+    
+    def __init__(self):
+        """Initialize empty root storage."""
+        self._keys = []             # Sorted roots
+        self._nodes = {}            # root -> AVLNode
+        self._linked_root = None    # Balanced tree view, rebuilt lazily
+    
+    def insert(self, root: str) -> None:
+        """
+        Insert a new Arabic root (or bump its frequency).
+        
+        The root is stored normalized (conservative, shadda expanded),
+        exactly like AVLTree.insert.
+        
+        Args:
+            root (str): Arabic root to insert (3 letters)
+        """
+        normalized_root = ArabicUtils.normalize_arabic(root, aggressive=False, expand_shadda=True)
+        
+        if not ArabicUtils.is_valid_root(normalized_root):
+            print(f"❌ '{root}' is not a valid Arabic root after normalization")
+            return
+        
+        node = self._nodes.get(normalized_root)
+        if node is not None:
+            node.frequency += 1
+            return
+        
+        self._store(normalized_root, AVLNode(normalized_root))
+        self._linked_root = None
+    
+    def _store(self, root: str, node: AVLNode) -> None:
+        """Add a new root and its node to the sorted storage."""
+        insort(self._keys, root)
+        self._nodes[root] = node
+    
+    def search(self, root: str) -> AVLNode:
+        """
+        Search for an Arabic root.
+        
+        Args:
+            root (str): Arabic root to search for
+        
+        Returns:
+            AVLNode: Node containing the root, or None if not found
+        """
+        return self._nodes.get(root)
+    
+    def lookup(self, root: str) -> AVLNode:
+        """Find the node of an already-normalized root (same as search)."""
+        return self._nodes.get(root)
+    
+    def display_inorder(self) -> list:
+        """
+        Return all roots in sorted order.
+        
+        The list is the live storage; callers must not modify it.
+        
+        Returns:
+            list: Sorted list of Arabic roots
+        """
+        return self._keys
+    
+    def get_all_nodes(self) -> list[AVLNode]:
+        """
+        Get all nodes in sorted order.
+        
+        Their left/right links are those of the balanced tree view, so
+        callers inspecting node shape (e.g. counting leaves) see a real tree.
+        """
+        nodes = self._sorted_nodes()
+        if self._linked_root is None and nodes:
+            self._linked_root = self._link_balanced(nodes, 0, len(nodes))
+        return nodes
+    
+    def _sorted_nodes(self) -> list[AVLNode]:
+        """Nodes in sorted order, without touching the tree view."""
+        nodes = self._nodes
+        return [nodes[root] for root in self._keys]
+    
+    def count_nodes(self) -> int:
+        """Count total roots."""
+        return len(self._nodes)
+    
+    def get_tree_height(self) -> int:
+        """Get height of the balanced tree view (minimal height for n roots)."""
+        return len(self._nodes).bit_length()
+    
+    def _structure_stats(self) -> dict:
+        """Structural statistics, read straight from the sorted storage."""
+        return {
+            'count': len(self._nodes),
+            'height': self.get_tree_height(),
+            'roots': self.display_inorder(),
+            'nodes': self.get_all_nodes()
+        }
+    
+    # ========== BALANCED TREE VIEW ==========
+    
+    @property
+    def root(self) -> AVLNode:
+        """Root of a perfectly balanced tree linked over the sorted nodes."""
+        if self._linked_root is None and self._nodes:
+            self._linked_root = self._link_balanced(self._sorted_nodes(), 0, len(self._nodes))
+        return self._linked_root
+    
+    def _link_balanced(self, nodes: list, lo: int, hi: int) -> AVLNode:
+        """
+        Link nodes[lo:hi] into a balanced subtree (recursion depth is O(log n)).
+        
+        Args:
+            nodes (list): Nodes in sorted order
+            lo (int): First index of the range
+            hi (int): One past the last index of the range
+        
+        Returns:
+            AVLNode: Root of the subtree, or None for an empty range
+        """
+        if lo >= hi:
+            return None
+        
+        mid = (lo + hi) // 2
+        node = nodes[mid]
+        node.left = self._link_balanced(nodes, lo, mid)
+        node.right = self._link_balanced(nodes, mid + 1, hi)
+        self._update_node(node)
+        return node
+
+
+class SortedDictRoots(SortedListRoots):
+    """Arabic roots kept in a SortedDict, with the AVLTree interface."""
+    
+    def __init__(self):
+        """Initialize empty root storage."""
+        if not SORTED_ROOTS_AVAILABLE:
+            raise ImportError("SortedDictRoots requires the 'sortedcontainers' package")
+        super().__init__()
+        self._nodes = SortedDict()  # root -> AVLNode, iterated in sorted order
+        self._inorder_cache = None  # Sorted root list, rebuilt lazily
+    
+    def _store(self, root: str, node: AVLNode) -> None:
+        """Add a new root and its node to the sorted storage."""
+        self._nodes[root] = node
+        self._inorder_cache = None
+    
+    def display_inorder(self) -> list:
+        """
+        Return all roots in sorted order.
+        
+        The list is cached until the next insertion of a new root;
+        callers must not modify it.
+        
+        Returns:
+            list: Sorted list of Arabic roots
+        """
+        if self._inorder_cache is None:
+            self._inorder_cache = list(self._nodes.keys())
+        return self._inorder_cache
+    
+    def _sorted_nodes(self) -> list[AVLNode]:
+        """Nodes in sorted order, without touching the tree view."""
+        return list(self._nodes.values())
@@ -0,0 +1,63 @@
+"""
+Test file for Arabic text utilities.
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from arabic_utils import ArabicUtils
+
+def test_normalize_mixed_script():
+    """Test that Latin, digits and punctuation are dropped around Arabic text."""
+    assert ArabicUtils.normalize_arabic("abc كَتَبَ 123!") == "كتب"
+    assert ArabicUtils.normalize_arabic("كتب-2024-درس") == "كتبدرس"
+    assert ArabicUtils.normalize_arabic("hello world") == ""
+
+    # Letter variants are still unified once the Latin text is gone
+    assert ArabicUtils.normalize_arabic("x مدرسةٌ y") == "مدرسه"
+    assert ArabicUtils.normalize_arabic("(أكل)", aggressive=True) == "اكل"
+    assert ArabicUtils.normalize_arabic("(أكل)") == "أكل"
+    print("✅ test_normalize_mixed_script passed")
+
+def test_shadda_next_to_latin():
+    """Test that shadda doubles its own neighbour, even a removed one."""
+    # Shadda after an Arabic letter doubles it
+    assert ArabicUtils.normalize_arabic("aمدّb") == "مدد"
+    # Shadda after a Latin letter doubles that letter, which is then dropped
+    assert ArabicUtils.normalize_arabic("بaّ") == "ب"
+    print("✅ test_shadda_next_to_latin passed")
+
+def test_strip_diacritics():
+    """Test that only tashkeel is removed, letters and other text are kept."""
+    assert ArabicUtils.strip_diacritics("كَتَبَ") == "كتب"
+    assert ArabicUtils.strip_diacritics("مُدَّ") == "مد"
+    assert ArabicUtils.strip_diacritics("أَكَلَ 2x") == "أكل 2x"
+    assert ArabicUtils.strip_diacritics("") == ""
+    print("✅ test_strip_diacritics passed")
+
+def test_presentation_forms_folded():
+    """Test that presentation-form letters are folded, not dropped."""
+    assert ArabicUtils.normalize_arabic("ﻛﺘﺐ") == "كتب"
+    assert ArabicUtils.normalize_arabic("ﻻ") == "لا"
+    assert ArabicUtils.normalize_arabic("ﺃﻛﻞ", aggressive=True) == "اكل"
+    assert ArabicUtils.is_valid_root("ﻗﺮﺃ")
+    print("✅ test_presentation_forms_folded passed")
+
+def test_find_pattern_match_many():
+    """Test that checking many words at once agrees with the single check."""
+    words = ["كاتب", "كَاتِب", "كتب", "قارئ", ""]
+    expected = [ArabicUtils.find_pattern_match(w, "كتب", "1ا23") for w in words]
+    assert ArabicUtils.find_pattern_match_many(words, "كتب", "1ا23") == expected
+    assert expected[:3] == [True, True, False]
+
+    # Invalid template: nothing matches
+    assert ArabicUtils.find_pattern_match_many(words, "كتب", "1ا24") == [False] * len(words)
+    print("✅ test_find_pattern_match_many passed")
+
+if __name__ == "__main__":
+    test_normalize_mixed_script()
+    test_shadda_next_to_latin()
+    test_strip_diacritics()
+    test_presentation_forms_folded()
+    test_find_pattern_match_many()
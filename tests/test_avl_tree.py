@@ -100,6 +100,47 @@ def test_empty_tree():
     
     print("✅ test_empty_tree passed")
 
+def test_inorder_cache_and_lookup():
+    """Test that the cached inorder list is refreshed after inserts."""
+    tree = AVLTree()
+    tree.insert("كتب")
+    tree.insert("درس")
+    assert tree.display_inorder() == ["درس", "كتب"]
+    
+    # New root invalidates the cache
+    tree.insert("عمل")
+    assert tree.display_inorder() == ["درس", "عمل", "كتب"]
+    
+    # lookup agrees with search
+    for root in ["كتب", "درس", "عمل", "فهم"]:
+        assert tree.lookup(root) is tree.search(root)
+    
+    print("✅ test_inorder_cache_and_lookup passed")
+
+def test_tree_stats():
+    """Test that single-pass stats agree with the individual queries."""
+    tree = AVLTree()
+    for root in ["كتب", "قرأ", "درس", "عمل", "فهم"]:
+        tree.insert(root)
+    tree.search("كتب").add_derivative("كاتب", "فاعل")
+    tree.search("كتب").add_derivative("مكتوب", "مفعول")
+    
+    stats = tree.get_tree_stats()
+    assert stats['count'] == tree.count_nodes() == 5
+    assert stats['height'] == tree.get_tree_height()
+    assert stats['roots'] == tree.display_inorder()
+    assert stats['with_derivatives'] == 1
+    assert stats['without_derivatives'] == 4
+    assert stats['total_derivatives'] == 2
+    
+    # Derivative counts follow node changes; structure follows inserts
+    tree.search("درس").add_derivative("دارس", "فاعل")
+    tree.insert("سمع")
+    stats = tree.get_tree_stats()
+    assert stats['count'] == 6 and "سمع" in stats['roots']
+    assert stats['with_derivatives'] == 2
+    print("✅ test_tree_stats passed")
+
 if __name__ == "__main__":
     print("🚀 Running AVL Tree Tests...\n")
     
@@ -118,4 +159,10 @@ if __name__ == "__main__":
     test_duplicate_roots()
     print()
     
+    test_inorder_cache_and_lookup()
+    print()
+    
+    test_tree_stats()
+    print()
+    
     print("🎉 All tests passed! AVL Tree is working correctly.")
\ No newline at end of file
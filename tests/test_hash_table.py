@@ -141,6 +141,28 @@ def test_get_all_patterns():
     print("✅ Retrieved patterns:", [p[0] for p in all_patterns])
     print("✅ test_get_all_patterns passed")
 
+def test_version_and_patterns_cache():
+    """Test that changes bump the version and refresh the cached pattern list."""
+    ht = HashTable(10)
+    assert ht.version == 0
+    
+    ht.insert("فاعل", {"template": "1ا2و3"})
+    first = ht.get_all_patterns()
+    assert ht.get_all_patterns() is first  # Cached while unchanged
+    
+    version = ht.version
+    ht.insert("فاعل", {"template": "1ا23"})  # Update also counts
+    assert ht.version > version
+    assert ht.get_all_patterns()[0][1]["template"] == "1ا23"
+    
+    version = ht.version
+    assert not ht.delete("مفعول")
+    assert ht.version == version  # Failed delete changes nothing
+    assert ht.delete("فاعل")
+    assert ht.version > version
+    assert ht.get_all_patterns() == []
+    print("✅ test_version_and_patterns_cache passed")
+
 def test_statistics():
     """Test hash table statistics."""
     ht = HashTable(10)
@@ -182,6 +204,9 @@ if __name__ == "__main__":
     test_get_all_patterns()
     print()
     
+    test_version_and_patterns_cache()
+    print()
+    
     test_resize()
     print()
     
@@ -4,9 +4,11 @@ Test file for Morphological Engine.
 
 import sys
 import os
+import tempfile
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from morphology import MorphologicalEngine
+from pattern_manager import read_json_file
 
 def test_word_generation():
     """Test word generation from root and pattern."""
@@ -78,6 +80,11 @@ def test_validation():
     validation = engine.validate_word("كتاب", "قرأ")
     assert validation['is_valid'] == False
     
+    # Non-Arabic input is rejected without searching
+    validation = engine.validate_word("hello 123")
+    assert validation['is_valid'] == False
+    assert validation['possible_roots'] == []
+    
     print("✅ test_validation passed")
 
 def test_generate_all():
@@ -165,6 +172,25 @@ def test_arabic_utils_integration():
     print("✅ Arabic utilities working correctly")
     print("✅ test_arabic_utils_integration passed")
 
+def test_import_patterns_file():
+    """Test reading and importing a patterns JSON file."""
+    engine = MorphologicalEngine()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        good = os.path.join(tmp, "patterns.json")
+        with open(good, 'w', encoding='utf-8') as f:
+            f.write('{"فاعل": {"template": "1ا23", "description": "اسم الفاعل"}}')
+        bad = os.path.join(tmp, "bad.json")
+        with open(bad, 'w', encoding='utf-8') as f:
+            f.write('{"فاعل": ')
+        
+        assert read_json_file(good) == {"فاعل": {"template": "1ا23", "description": "اسم الفاعل"}}
+        assert engine.import_patterns_from_file(good)[0]
+        assert engine.patterns_table.search("فاعل")['template'] == "1ا23"
+        assert engine.import_patterns_from_file(bad) == (False, "Invalid JSON file")
+    
+    print("✅ test_import_patterns_file passed")
+
 if __name__ == "__main__":
     print("🧪 Running Morphological Engine Tests...")
     print("=" * 60)
@@ -184,6 +210,9 @@ if __name__ == "__main__":
     test_statistics()
     print()
     
+    test_import_patterns_file()
+    print()
+    
     print("=" * 60)
     print("🎉 All morphological engine tests passed!")
     print("\n✅ Ready to build the complete CLI application!")
\ No newline at end of file
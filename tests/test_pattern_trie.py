@@ -0,0 +1,44 @@
+"""
+Test file for the pattern trie.
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pattern_trie import ArabicPatternTrie
+
+def test_match_extracts_root():
+    """Test that a match returns the template and root letters."""
+    trie = ArabicPatternTrie()
+    trie.insert("1ا23")
+    trie.insert("م12و3")
+
+    assert list(trie.match("كاتب")) == [("1ا23", ('ك', 'ت', 'ب'))]
+    assert list(trie.match("مكتوب")) == [("م12و3", ('ك', 'ت', 'ب'))]
+    assert list(trie.match("كتاب")) == []
+    print("✅ test_match_extracts_root passed")
+
+def test_shadda_repeats_root_letter():
+    """Test that shadda after a root position requires a doubled letter."""
+    trie = ArabicPatternTrie()
+    trie.insert("12ّ3", "فعّل")
+
+    assert list(trie.match("درّس")) == [("فعّل", ('د', 'ر', 'س'))]
+    assert list(trie.match("دررس")) == [("فعّل", ('د', 'ر', 'س'))]
+    assert list(trie.match("درسس")) == []
+    print("✅ test_shadda_repeats_root_letter passed")
+
+def test_invalid_template_skipped():
+    """Test that templates with bad root positions are not inserted."""
+    trie = ArabicPatternTrie()
+
+    assert trie.insert("1ا24") is False
+    assert trie.insert("123") is True
+    assert len(trie) == 1
+    print("✅ test_invalid_template_skipped passed")
+
+if __name__ == "__main__":
+    test_match_extracts_root()
+    test_shadda_repeats_root_letter()
+    test_invalid_template_skipped()
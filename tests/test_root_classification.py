@@ -252,6 +252,39 @@ def test_shadda_handling():
     
     return all_passed
 
+def test_count_categories():
+    """Test that single-pass category counting agrees with classify()."""
+    roots = ["كتب", "أكل", "قرأ", "قال", "رمى", "مدّ", "شدد", "وعد", "كت", "كتبة"]
+    
+    expected = {}
+    for root in roots:
+        category = RootClassifier.classify(root).category
+        expected[category] = expected.get(category, 0) + 1
+    
+    counts = RootClassifier.count_categories(roots)
+    assert {cat: n for cat, n in counts.items() if n} == expected
+    assert sum(counts.values()) == len(roots)
+    print("✅ test_count_categories passed")
+
+def test_find_examples():
+    """Test the cached example lookup by subtype or category name."""
+    assert RootClassifier.find_examples("أجوف") == tuple(RootClassifier.get_examples()["أجوف"])
+    assert RootClassifier.find_examples("مهموز") == tuple(RootClassifier.get_examples()["مهموز الفاء"])
+    assert RootClassifier.find_examples("غير موجود") is None
+    
+    analysis = RootClassifier.classify("قال")
+    assert "قال" in RootClassifier.find_examples(analysis.subtype)
+    print("✅ test_find_examples passed")
+
+def test_generate_cached():
+    """Test that cached generation matches direct generation."""
+    for root in ["كتب", "قرأ", "وعد", "رمى", "مدّ"]:
+        for name, template in [("فاعل", "1ا23"), ("مفعول", "م12و3")]:
+            expected = RootClassifier.generate_with_root_type(root, template, name)
+            assert RootClassifier.generate_cached(root, template, name) == expected
+            assert RootClassifier.generate_cached(root, template, name) == expected
+    print("✅ test_generate_cached passed")
+
 if __name__ == "__main__":
     print("🧪 Running Root Classification Tests...")
     print("=" * 60)
@@ -271,6 +304,15 @@ if __name__ == "__main__":
     test_root_analysis_display()
     print()
     
+    test_count_categories()
+    print()
+    
+    test_find_examples()
+    print()
+    
+    test_generate_cached()
+    print()
+    
     print("=" * 60)
     print("🎉 Root classification system implemented successfully!")
     print("\n✅ Can now handle all Arabic root types:")
@@ -0,0 +1,85 @@
+"""
+Test the sorted-container root storages against the AVL tree.
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from avl_tree import AVLTree
+from sorted_roots import SortedListRoots, SortedDictRoots, SORTED_ROOTS_AVAILABLE
+from morphology import MorphologicalEngine
+
+ROOTS = ["كتب", "قرأ", "درس", "عمل", "فهم", "مدّ", "كتب", "سأل", "xyz"]
+
+def _check_same_as_avl(sorted_roots):
+    """Insert ROOTS in both stores and compare their answers."""
+    avl = AVLTree()
+    for root in ROOTS:
+        avl.insert(root)
+        sorted_roots.insert(root)
+    
+    assert sorted_roots.display_inorder() == avl.display_inorder()
+    assert sorted_roots.count_nodes() == avl.count_nodes()
+    assert [n.root for n in sorted_roots.get_all_nodes()] == avl.display_inorder()
+    assert sorted_roots.search("كتب").frequency == 2
+    assert sorted_roots.search("مدد") is not None
+    assert sorted_roots.lookup("غيرموجود") is None
+    
+    # Derivatives live on the same AVLNode objects
+    sorted_roots.search("كتب").add_derivative("كاتب", "فاعل")
+    assert sorted_roots.remove_derivative("كتب", "كاتب", "فاعل")
+    assert not sorted_roots.remove_derivative("كتب", "كاتب", "فاعل")
+
+def _check_balanced_view(sorted_roots):
+    """Check that the tree views work on the balanced linked view."""
+    assert sorted_roots.root is None
+    assert sorted_roots.get_tree_height() == 0
+    
+    for root in ROOTS:
+        sorted_roots.insert(root)
+    
+    structure = sorted_roots.get_tree_structure()
+    assert structure['height'] == sorted_roots.get_tree_height() == 3
+    assert abs(structure['balance']) <= 1
+    assert "كتب" in sorted_roots.display_tree_ascii()
+    
+    # A new root rebuilds the view
+    sorted_roots.insert("جلس")
+    assert sorted_roots.count_nodes() == 8
+    assert sorted_roots.get_tree_structure()['height'] == 4
+    
+    # Nodes handed out by get_all_nodes carry the view's links
+    nodes = sorted_roots.get_all_nodes()
+    leaves = sum(1 for node in nodes if node.left is None and node.right is None)
+    assert leaves == 4
+
+def test_sorted_list_roots():
+    """Test that SortedListRoots answers like AVLTree."""
+    _check_same_as_avl(SortedListRoots())
+    _check_balanced_view(SortedListRoots())
+    print("✅ test_sorted_list_roots passed")
+
+def test_sorted_dict_roots():
+    """Test that SortedDictRoots answers like AVLTree."""
+    if not SORTED_ROOTS_AVAILABLE:
+        print("⚠️ sortedcontainers not installed, skipping")
+        return
+    
+    _check_same_as_avl(SortedDictRoots())
+    _check_balanced_view(SortedDictRoots())
+    print("✅ test_sorted_dict_roots passed")
+
+def test_engine_backend():
+    """Test that the engine picks the configured backend."""
+    assert type(MorphologicalEngine().roots_tree) is SortedListRoots
+    assert type(MorphologicalEngine('avl').roots_tree) is AVLTree
+    engine = MorphologicalEngine('sorted_dict')
+    expected = SortedDictRoots if SORTED_ROOTS_AVAILABLE else SortedListRoots
+    assert type(engine.roots_tree) is expected
+    print("✅ test_engine_backend passed")
+
+if __name__ == "__main__":
+    test_sorted_list_roots()
+    test_sorted_dict_roots()
+    test_engine_backend()
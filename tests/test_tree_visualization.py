@@ -4,6 +4,7 @@ Test tree visualization and structure.
 
 import sys
 import os
+import io
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from avl_tree import AVLTree
@@ -138,6 +139,50 @@ def test_balance_factor():
     print("If |balance| > 1, tree is unbalanced → rotation needed")
     print("=" * 60)
 
+def test_iter_tree_structure():
+    """Test that streamed records match the nested structure."""
+    tree = AVLTree()
+    assert list(tree.iter_tree_structure()) == []
+    
+    for root in ["كتب", "قرأ", "درس", "عمل", "فهم", "سمع", "نظر", "ذهب"]:
+        tree.insert(root)
+    tree.search("كتب").add_derivative("كاتب", "فاعل")
+    
+    # Flatten the nested dict in the same (pre-order) order
+    expected = []
+    stack = [(tree.get_tree_structure(), 0)]
+    while stack:
+        entry, depth = stack.pop()
+        if entry is None:
+            continue
+        expected.append((depth, entry['root'], entry['height'], entry['balance'],
+                         entry['derivative_count'], entry['frequency']))
+        stack.append((entry['right'], depth + 1))
+        stack.append((entry['left'], depth + 1))
+    
+    records = list(tree.iter_tree_structure())
+    assert records == expected
+    assert len(records) == tree.count_nodes()
+    assert records[0][0] == 0 and records[0][2] == tree.get_tree_height()
+    print("✅ test_iter_tree_structure passed")
+
+def test_ascii_tree_to_stream():
+    """Test that writing the ASCII tree to a stream gives the same text."""
+    tree = AVLTree()
+    for root in ["كتب", "قرأ", "درس", "عمل", "فهم"]:
+        tree.insert(root)
+    tree.search("درس").add_derivative("دارس", "فاعل")
+    
+    buffer = io.StringIO()
+    assert tree.display_tree_ascii(out=buffer) == ""
+    assert buffer.getvalue() == tree.display_tree_ascii()
+    assert "درس (h=" in buffer.getvalue() and "[Derivatives: 1]" in buffer.getvalue()
+    
+    empty = io.StringIO()
+    AVLTree().display_tree_ascii(out=empty)
+    assert empty.getvalue() == ""
+    print("✅ test_ascii_tree_to_stream passed")
+
 # Add these to the main test
 if __name__ == "__main__":
     print("🌲 Running Tree Visualization Tests...")
@@ -158,6 +203,12 @@ if __name__ == "__main__":
     test_tree_visualization()
     print()
     
+    test_iter_tree_structure()
+    print()
+    
+    test_ascii_tree_to_stream()
+    print()
+    
     print("=" * 60)
     print("🎉 All tree visualization tests passed!")
     print("\n📈 Tree visualization is now available in the CLI!")
\ No newline at end of file